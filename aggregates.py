@@ -0,0 +1,105 @@
+"""Накопительные показатели тренировок по спортсменам.
+
+Агрегатор хранит для каждой пары (спортсмен, тип тренировки) только
+суммы, количество, минимум, максимум и дисперсию по Уэлфорду, поэтому
+обновление стоит O(1), а сырые тренировки хранить не нужно. Агрегаторы
+разных шардов объединяются методом `merge`.
+"""
+import math
+from typing import Dict, Hashable, Tuple
+
+from homework import InfoMessage, read_package
+
+METRICS = ('duration', 'distance', 'speed', 'calories')
+
+Key = Tuple[Hashable, str]
+
+
+class RunningStats:
+    """Количество, сумма, среднее, дисперсия и границы ряда значений."""
+    __slots__ = ('count', 'total', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        """Учесть одно значение."""
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: 'RunningStats') -> None:
+        """Добавить показатели другого ряда."""
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Выборочная дисперсия."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {'count': self.count, 'total': self.total,
+                'mean': self.mean, 'variance': self.variance,
+                'min': self.minimum, 'max': self.maximum}
+
+
+class TrainingAggregator:
+    """Показатели `METRICS` по спортсменам и типам тренировок."""
+
+    def __init__(self) -> None:
+        self.stats: Dict[Key, Dict[str, RunningStats]] = {}
+
+    def _series(self, key: Key) -> Dict[str, RunningStats]:
+        series = self.stats.get(key)
+        if series is None:
+            series = self.stats[key] = {
+                metric: RunningStats() for metric in METRICS}
+        return series
+
+    def add(self, user: Hashable, info: InfoMessage) -> None:
+        """Учесть сообщение о тренировке спортсмена."""
+        series = self._series((user, info.training_type))
+        for metric in METRICS:
+            series[metric].add(getattr(info, metric))
+
+    def add_package(self, user: Hashable,
+                    workout_type: str, data: list) -> None:
+        """Учесть сырой пакет от датчиков спортсмена."""
+        self.add(user, read_package(workout_type, data).show_training_info())
+
+    def merge(self, other: 'TrainingAggregator') -> None:
+        """Добавить показатели другого агрегатора."""
+        for key, other_series in other.stats.items():
+            series = self._series(key)
+            for metric in METRICS:
+                series[metric].merge(other_series[metric])
+
+    def get(self, user: Hashable,
+            training_type: str) -> Dict[str, Dict[str, float]]:
+        """Получить показатели спортсмена по типу тренировки."""
+        series = self.stats.get((user, training_type))
+        if series is None:
+            raise KeyError((user, training_type))
+        return {metric: stats.as_dict() for metric, stats in series.items()}
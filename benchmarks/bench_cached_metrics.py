@@ -0,0 +1,102 @@
+"""Цена кэширования показателей на объектах тренировок.
+
+Сравнивает классы `homework`, которые считают показатели заново, с
+копиями, где методы расчёта обёрнуты в `cached_metric`: число
+вычислений дистанции на одно сообщение и время создания сообщения и
+повторных обращений к показателям. Сверка полей при чтении кэша
+дороже самих формул, поэтому в `homework` показатели не кэшируются.
+Запуск: python benchmarks/bench_cached_metrics.py [количество объектов]
+"""
+import sys
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Callable
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import homework  # noqa: E402
+
+PACKAGES = {
+    'SWM': [720, 1, 80, 25, 40],
+    'RUN': [15000, 1, 75],
+    'WLK': [9000, 1, 75, 180],
+}
+METHODS = ('get_distance', 'get_mean_speed', 'get_spent_calories')
+
+
+def cached_metric(method: Callable) -> Callable:
+    """Считать показатель один раз, пока не изменились поля `FIELDS`.
+
+    Поля читаются через `getattr`, так что учитываются и свойства.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        inputs = tuple(getattr(self, field) for field in self.FIELDS)
+        cache = self.__dict__.get('_metrics')
+        if cache is None or cache[0] != inputs:
+            cache = self.__dict__['_metrics'] = (inputs, {})
+        metrics = cache[1]
+        if name not in metrics:
+            metrics[name] = method(self)
+        return metrics[name]
+    return wrapper
+
+
+def cached(cls: type) -> type:
+    """Копия класса с кэшируемыми методами расчёта."""
+    namespace = {name: cached_metric(getattr(cls, name))
+                 for name in METHODS}
+    return type(cls.__name__, (cls,), namespace)
+
+
+def distance_calls(cls: type, data: list) -> int:
+    """Сколько раз считается дистанция при вызове show_training_info."""
+    calls = 0
+    raw = homework.Training.get_distance
+
+    def counted(self):
+        nonlocal calls
+        calls += 1
+        return raw(self)
+
+    if 'get_distance' in vars(cls):
+        counted = cached_metric(counted)
+    counting = type(cls.__name__, (cls,), {'get_distance': counted})
+    counting(*data).show_training_info()
+    return calls
+
+
+def timed(cls: type, data: list, count: int, reads: int) -> float:
+    """Наносекунды на объект: сообщение и `reads` чтений калорий."""
+    trainings = [cls(*data) for _ in range(count)]
+    start = time.perf_counter_ns()
+    for training in trainings:
+        training.show_training_info()
+        for _ in range(reads):
+            training.get_spent_calories()
+    return (time.perf_counter_ns() - start) / count
+
+
+def main(count: int) -> None:
+    """Вывести сравнение для всех типов тренировок."""
+    print(f'{"тип":<14} {"дистанций":>14} {"сообщение, нс":>18} '
+          f'{"+3 чтения, нс":>18}')
+    for code, data in PACKAGES.items():
+        plain = homework.WORKOUT_TYPES[code]
+        memo = cached(plain)
+        calls = f'{distance_calls(plain, data)} -> ' \
+                f'{distance_calls(memo, data)}'
+        first = f'{timed(plain, data, count, 0):.0f} -> ' \
+                f'{timed(memo, data, count, 0):.0f}'
+        repeated = f'{timed(plain, data, count, 3):.0f} -> ' \
+                   f'{timed(memo, data, count, 3):.0f}'
+        print(f'{plain.__name__:<14} {calls:>14} {first:>18} '
+              f'{repeated:>18}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
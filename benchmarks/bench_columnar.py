@@ -0,0 +1,72 @@
+"""Колоночная выгрузка против строк `get_message`: размер и загрузка.
+
+Запуск: python benchmarks/bench_columnar.py [количество записей]
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import columnar  # noqa: E402
+import homework  # noqa: E402
+
+MESSAGE = re.compile(r'Тип тренировки: (\w+); Длительность: ([\d.]+) ч\.; '
+                     r'Дистанция: ([\d.]+) км; Ср\. скорость: ([\d.]+) км/ч; '
+                     r'Потрачено ккал: ([\d.]+)\.')
+
+
+def infos(count: int) -> list:
+    """Сообщения с разбросом значений."""
+    result = []
+    for i in range(count):
+        duration = 0.5 + i % 97 / 50
+        package = [('RUN', [9000 + i % 5000, duration, 60 + i % 40]),
+                   ('WLK', [6000 + i % 3000, duration, 60 + i % 40, 170]),
+                   ('SWM', [700 + i % 300, duration, 70, 25, 20 + i % 30])
+                   ][i % 3]
+        result.append(homework.read_package(*package).show_training_info())
+    return result
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(count: int) -> None:
+    """Вывести размеры файлов и время загрузки."""
+    messages = infos(count)
+    with tempfile.TemporaryDirectory() as path:
+        text_path = os.path.join(path, 'results.txt')
+        column_path = os.path.join(path, 'results.col')
+        with open(text_path, 'w') as file:
+            file.writelines(info.get_message() + '\n' for info in messages)
+        with columnar.ColumnarWriter(column_path) as writer:
+            writer.write_all(messages)
+
+        def parse_text():
+            with open(text_path) as file:
+                return [(kind, *map(float, numbers)) for kind, *numbers
+                        in (MESSAGE.match(line).groups() for line in file)]
+
+        rows = [
+            ('строки get_message', text_path, timed(parse_text)),
+            ('колонки, все', column_path,
+             timed(lambda: columnar.load(column_path))),
+            ('колонки, calories', column_path,
+             timed(lambda: columnar.load(column_path, ['calories']))),
+        ]
+        print(f'{"формат":<22} {"байт/запись":>12} {"загрузка, мс":>13}')
+        for name, file_path, elapsed in rows:
+            size = os.path.getsize(file_path) / count
+            print(f'{name:<22} {size:>12.1f} {elapsed * 1000:>13.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
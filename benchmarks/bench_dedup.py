@@ -0,0 +1,49 @@
+"""Объединение повторов против расчёта каждого пакета.
+
+Пакеты выбираются из набора пресетов с распределением Ципфа, как у
+парка устройств с несколькими популярными настройками.
+Запуск: python benchmarks/bench_dedup.py [количество пакетов]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+from dedup import compute_deduplicated  # noqa: E402
+from homework import read_package  # noqa: E402
+
+
+def presets(count: int) -> list:
+    """Набор различающихся пресетов."""
+    return [[('RUN', [15000 + i, 1, 75]),
+             ('WLK', [9000 + i, 1, 75, 180]),
+             ('SWM', [720 + i, 1, 80, 25, 40])][i % 3]
+            for i in range(count)]
+
+
+def main(count: int) -> None:
+    """Вывести ускорение для разного числа пресетов."""
+    rng = random.Random(1)
+    print(f'{"пресетов":>9} {"повторов":>9} {"обычно, с":>10} '
+          f'{"с объединением, с":>18} {"ускорение":>10}')
+    for size in (10, 1000, 100_000):
+        variants = presets(size)
+        weights = [1 / (rank + 1) for rank in range(size)]
+        packages = rng.choices(variants, weights, k=count)
+        start = time.perf_counter()
+        plain = [read_package(workout_type, data).show_training_info()
+                 for workout_type, data in packages]
+        plain_time = time.perf_counter() - start
+        start = time.perf_counter()
+        result = compute_deduplicated(packages)
+        dedup_time = time.perf_counter() - start
+        assert result.infos == plain
+        print(f'{size:>9} {result.ratio:>9.1f} {plain_time:>10.3f} '
+              f'{dedup_time:>18.3f} {plain_time / dedup_time:>10.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
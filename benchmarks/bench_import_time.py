@@ -0,0 +1,63 @@
+"""Время запуска с плагинами тренировок: обычный импорт и ленивый.
+
+Создаёт во временном каталоге `count` модулей-плагинов и замеряет время
+запуска интерпретатора, который импортирует `homework` и подключает
+все плагины сразу или регистрирует их через `register_lazy_workout`.
+Запуск: python benchmarks/bench_import_time.py [количество плагинов]
+"""
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+
+PLUGIN = '''
+from homework import Training, register_workout
+
+
+@register_workout('P{index}')
+class Plugin{index}(Training):
+    LEN_STEP = 1.0 + {index} / 1000
+
+    def get_spent_calories(self):
+        return self.weight * self.duration
+'''
+
+
+def startup(code: str, path: str, repeat: int = 5) -> float:
+    """Лучшее время запуска интерпретатора с кодом `code`, мс."""
+    env_path = f'{BASE_DIR}:{path}'
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       env={'PYTHONPATH': env_path})
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(count: int) -> None:
+    """Вывести время запуска для трёх вариантов."""
+    with tempfile.TemporaryDirectory() as path:
+        for index in range(count):
+            Path(path, f'plugin_{index}.py').write_text(
+                PLUGIN.format(index=index))
+        eager = '\n'.join(f'import plugin_{index}' for index in range(count))
+        lazy = '\n'.join(
+            f'homework.register_lazy_workout("P{index}", '
+            f'"plugin_{index}:Plugin{index}")' for index in range(count))
+        variants = [
+            ('только homework', 'import homework'),
+            (f'{count} плагинов сразу', f'import homework\n{eager}'),
+            (f'{count} плагинов лениво', f'import homework\n{lazy}'),
+            ('лениво + первый вызов', f'import homework\n{lazy}\n'
+             'homework.read_package("P0", [1, 1, 1])'),
+        ]
+        for name, code in variants:
+            print(f'{name:<26} {startup(code, path):8.1f} мс')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,50 @@
+"""Замер памяти на одну запись: обычные и компактные классы.
+
+Запуск: python benchmarks/bench_memory.py [количество записей]
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import compact  # noqa: E402
+import homework  # noqa: E402
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def bytes_per_record(build, count: int) -> float:
+    """Посчитать среднее число байт на объект, созданный `build`."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(*PACKAGES[i % len(PACKAGES)]) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main(count: int) -> None:
+    """Вывести таблицу потребления памяти."""
+    rows = [
+        ('Training', homework.read_package, compact.read_package),
+        ('InfoMessage',
+         lambda *p: homework.read_package(*p).show_training_info(),
+         lambda *p: compact.read_package(*p).show_training_info()),
+    ]
+    print(f'{"класс":<12} {"обычный":>10} {"компактный":>11} {"экономия":>9}')
+    for name, regular, slotted in rows:
+        before = bytes_per_record(regular, count)
+        after = bytes_per_record(slotted, count)
+        print(f'{name:<12} {before:>10.1f} {after:>11.1f} '
+              f'{1 - after / before:>9.1%}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,34 @@
+"""Скорость разбора текстовых пакетов.
+
+Запуск: python benchmarks/bench_package_parser.py [количество строк]
+"""
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+from package_parser import parse_lines  # noqa: E402
+
+LINES = [
+    'SWM 720 1 80 25 40',
+    'RUN 15000 1 75',
+    'WLK 9000 1 75 180',
+    'RUN 15000 0 75',
+]
+
+
+def main(count: int) -> None:
+    """Вывести число строк в секунду и долю ошибок."""
+    lines = [LINES[i % len(LINES)] for i in range(count)]
+    errors = []
+    start = time.perf_counter()
+    deque(parse_lines(lines, errors), maxlen=0)
+    elapsed = time.perf_counter() - start
+    print(f'строк/с: {count / elapsed:,.0f}, ошибок: {len(errors)}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
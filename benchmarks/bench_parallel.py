@@ -0,0 +1,39 @@
+"""Масштабирование параллельной обработки по числу процессов.
+
+Запуск: python benchmarks/bench_parallel.py [количество пакетов]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import parallel  # noqa: E402
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def main(count: int) -> None:
+    """Вывести пропускную способность для 1..cpu_count процессов."""
+    packages = [PACKAGES[i % len(PACKAGES)] for i in range(count)]
+    workers = 1
+    single = None
+    print(f'{"процессов":>9} {"записей/с":>12} {"ускорение":>10}')
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        for _ in parallel.run_parallel(packages, workers=workers):
+            pass
+        rate = count / (time.perf_counter() - start)
+        single = single or rate
+        print(f'{workers:>9} {rate:>12,.0f} {rate / single:>10.2f}')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,67 @@
+"""Пакетный расчёт в float64, float32 и с фиксированной точкой.
+
+Входные колонки заранее приведены к типу режима, так что видна
+разница в объёме данных и скорости самого расчёта.
+Запуск: python benchmarks/bench_precision.py [количество записей]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+from batch import compute_batch, compute_batch_fixed  # noqa: E402
+from fixed_point import ONE  # noqa: E402
+
+REPEATS = 5
+
+
+def columns(count: int) -> dict:
+    """Колонки бега со случайными значениями."""
+    rng = np.random.default_rng(1)
+    duration = rng.uniform(0.5, 4, count)
+    return {'action': duration * rng.uniform(1600, 15000, count),
+            'duration': duration,
+            'weight': rng.uniform(40, 150, count)}
+
+
+def best_time(func) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(count: int) -> None:
+    """Вывести объём колонок, скорость и ошибку по калориям."""
+    data = columns(count)
+    exact = compute_batch('RUN', data)['calories']
+    single = {name: values.astype(np.float32)
+              for name, values in data.items()}
+    modes = [
+        ('float64', data, lambda: compute_batch('RUN', data)),
+        ('float32', single,
+         lambda: compute_batch('RUN', single, dtype=np.float32)),
+        ('фикс. точка', single, lambda: compute_batch_fixed('RUN', single)),
+    ]
+    print(f'{"режим":<12} {"байт/запись":>12} {"записей/с":>14} '
+          f'{"ошибка калорий":>15}')
+    for name, inputs, func in modes:
+        result = func()
+        calories = result['calories'].astype(np.float64)
+        if result['calories'].dtype == np.int32:
+            calories /= ONE
+        size = (sum(values.nbytes for values in inputs.values())
+                + sum(values.nbytes for values in result.values())) / count
+        error = np.max(np.abs(calories / exact - 1))
+        print(f'{name:<12} {size:>12.0f} {count / best_time(func):>14,.0f} '
+              f'{error:>15.1e}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
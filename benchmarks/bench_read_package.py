@@ -0,0 +1,48 @@
+"""Стоимость одного вызова `read_package`: старый и новый варианты.
+
+Запуск: python benchmarks/bench_read_package.py [количество вызовов]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import homework  # noqa: E402
+from homework import Running, SportsWalking, Swimming  # noqa: E402
+
+PACKAGES = [
+    ('SWM', (720, 1, 80, 25, 40)),
+    ('RUN', (15000, 1, 75)),
+    ('WLK', (9000, 1, 75, 180)),
+]
+
+
+def read_package_old(workout_type: str, data: list):
+    """Исходная версия: словарь собирается при каждом вызове."""
+    workout: dict = {'SWM': Swimming,
+                     'RUN': Running,
+                     'WLK': SportsWalking}
+    if workout_type not in workout.keys():
+        raise ValueError('Недоступная тренировка')
+    return workout[workout_type](*data)
+
+
+def main(number: int) -> None:
+    """Вывести время одного вызова на одних и тех же кортежах, в нс."""
+    variants = [
+        ('исходный read_package', read_package_old),
+        ('read_package', homework.read_package),
+        ('read_package_fast', homework.read_package_fast),
+    ]
+    for name, func in variants:
+        best = min(timeit.repeat(
+            lambda: [func(code, data) for code, data in PACKAGES],
+            number=number, repeat=5))
+        per_call = best / number / len(PACKAGES) * 1e9
+        print(f'{name:<22} {per_call:8.1f} нс/вызов')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,69 @@
+"""Нагрузочный тест асинхронного сервиса.
+
+Запускает сервис в том же процессе, подключает несколько клиентов и
+выводит пропускную способность и задержки ответов.
+Запуск: python benchmarks/bench_service.py [клиентов] [запросов на клиента]
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+from service import TrainingService  # noqa: E402
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+WINDOW = 64
+
+
+async def client(port: int, requests: int, latencies: list) -> None:
+    """Отправлять запросы окном по WINDOW и замерять задержки."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    lines = [(json.dumps({'workout_type': code, 'data': data}) + '\n')
+             .encode() for code, data in PACKAGES]
+    sent = []
+    received = 0
+    while received < requests:
+        while len(sent) - received < WINDOW and len(sent) < requests:
+            writer.write(lines[len(sent) % len(lines)])
+            sent.append(time.perf_counter())
+        await writer.drain()
+        await reader.readline()
+        latencies.append(time.perf_counter() - sent[received])
+        received += 1
+    writer.close()
+
+
+async def main(clients: int, requests: int) -> None:
+    """Вывести результаты нагрузочного теста."""
+    service = TrainingService()
+    server = await service.start('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, requests, latencies)
+                           for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await service.stop()
+    latencies.sort()
+    total = clients * requests
+    print(f'запросов:      {total}')
+    print(f'запросов/с:    {total / elapsed:,.0f}')
+    print(f'микропакетов:  {service.batches} '
+          f'(в среднем {service.processed / service.batches:.1f})')
+    for name, share in (('p50', 0.5), ('p99', 0.99)):
+        value = latencies[min(int(total * share), total - 1)] * 1000
+        print(f'{name}:           {value:.2f} мс')
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+                     int(sys.argv[2]) if len(sys.argv) > 2 else 1000))
@@ -0,0 +1,138 @@
+"""Набор замеров горячих путей `homework.py` с контролем регрессий.
+
+Каждый метод замеряется для всех типов тренировок на нескольких
+размерах входных данных; результат выводится в наносекундах на запись.
+Запуск:
+    python benchmarks/bench_suite.py --save       # сохранить базу
+    python benchmarks/bench_suite.py              # сравнить с базой
+Код возврата 1 означает, что хотя бы один замер медленнее базы больше,
+чем на `--threshold`.
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import homework  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+PACKAGES = {
+    'SWM': [720, 1, 80, 25, 40],
+    'RUN': [15000, 1, 75],
+    'WLK': [9000, 1, 75, 180],
+}
+
+
+def _trainings(code: str, size: int) -> List[homework.Training]:
+    return [homework.read_package(code, PACKAGES[code])
+            for _ in range(size)]
+
+
+def _infos(code: str, size: int) -> List[homework.InfoMessage]:
+    return [training.show_training_info()
+            for training in _trainings(code, size)]
+
+
+def _packages(code: str, size: int) -> List[tuple]:
+    return [(code, PACKAGES[code])] * size
+
+
+def _end_to_end(packages: List[tuple]) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        for workout_type, data in packages:
+            homework.main(homework.read_package(workout_type, data))
+
+
+CASES: Dict[str, tuple] = {
+    'get_distance': (_trainings, lambda items: [
+        item.get_distance() for item in items]),
+    'get_mean_speed': (_trainings, lambda items: [
+        item.get_mean_speed() for item in items]),
+    'get_spent_calories': (_trainings, lambda items: [
+        item.get_spent_calories() for item in items]),
+    'show_training_info': (_trainings, lambda items: [
+        item.show_training_info() for item in items]),
+    'get_message': (_infos, lambda items: [
+        item.get_message() for item in items]),
+    'read_package': (_packages, lambda items: [
+        homework.read_package(code, data) for code, data in items]),
+    'read_package+main': (_packages, _end_to_end),
+}
+
+
+def measure(make_inputs: Callable, run: Callable, code: str, size: int,
+            repeat: int) -> float:
+    """Лучшее из `repeat` время в наносекундах на запись.
+
+    Входные данные создаются заново перед каждым повтором и не входят
+    в замер.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        items = make_inputs(code, size)
+        start = time.perf_counter_ns()
+        run(items)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / size
+
+
+def run_suite(sizes: List[int], repeat: int) -> Dict[str, float]:
+    """Выполнить все замеры и вывести их."""
+    results = {}
+    for case, (make_inputs, run) in CASES.items():
+        for code in PACKAGES:
+            for size in sizes:
+                name = f'{case}[{code}-{size}]'
+                results[name] = measure(make_inputs, run, code, size, repeat)
+                print(f'{name:<36} {results[name]:10.1f} нс/запись')
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[str]:
+    """Вернуть описания замеров, ставших медленнее базы."""
+    regressions = []
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base and value > base * (1 + threshold):
+            regressions.append(f'{name}: {base:.1f} -> {value:.1f} нс '
+                               f'({value / base - 1:+.0%})')
+    return regressions
+
+
+def main() -> int:
+    """Точка входа набора замеров."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='допустимое замедление, доля (0.2 = 20%%)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save', action='store_true',
+                        help='сохранить результаты как базу')
+    args = parser.parse_args()
+    results = run_suite(args.sizes, args.repeat)
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f'База сохранена в {args.baseline}')
+        return 0
+    if not args.baseline.exists():
+        print('База не найдена, запустите с --save')
+        return 0
+    regressions = compare(results, json.loads(args.baseline.read_text()),
+                          args.threshold)
+    for line in regressions:
+        print(f'РЕГРЕССИЯ {line}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Масштабирование обработки в пуле потоков.
+
+На обычной сборке CPython потоки упираются в GIL; на сборке без GIL
+(free-threaded, python3.13t и новее) пропускная способность растёт с
+числом потоков.
+Запуск: python benchmarks/bench_threaded.py [количество пакетов]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+from threaded import ShardedCounter, run_threaded  # noqa: E402
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def main(count: int) -> None:
+    """Вывести пропускную способность для 1..2*cpu_count потоков."""
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL '
+          f'{"включён" if gil else "выключен"}, ядер: {os.cpu_count()}')
+    packages = [PACKAGES[i % len(PACKAGES)] for i in range(count)]
+    workers = 1
+    single = None
+    print(f'{"потоков":>8} {"записей/с":>12} {"ускорение":>10}')
+    while workers <= 2 * (os.cpu_count() or 1):
+        counter = ShardedCounter()
+        start = time.perf_counter()
+        for _ in run_threaded(packages, workers=workers, counter=counter):
+            pass
+        rate = count / (time.perf_counter() - start)
+        assert sum(counter.totals().values()) == count
+        single = single or rate
+        print(f'{workers:>8} {rate:>12,.0f} {rate / single:>10.2f}')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
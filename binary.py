@@ -0,0 +1,137 @@
+"""Двоичный формат пакетов с фиксированной длиной записи.
+
+Файл начинается с сигнатуры `MAGIC`, за которой идут записи `RECORD`:
+код тренировки, число заполненных полей и значения полей в порядке
+`FIELDS` класса тренировки. Чтение идёт через `mmap` без копирования
+файла в объекты Python.
+"""
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from batch import Columns, compute_batch
+from homework import get_workout
+
+MAGIC = b'TRKPKG\x00\x01'
+MAX_FIELDS = 5
+CODE_SIZE = 4
+RECORD = np.dtype([('code', f'S{CODE_SIZE}'),
+                   ('count', '<u4'),
+                   ('values', '<f8', (MAX_FIELDS,))])
+
+Package = Tuple[str, tuple]
+
+
+def _to_records(packages: Iterable[Package]) -> np.ndarray:
+    """Собрать массив записей из пакетов."""
+    packages = list(packages)
+    records = np.zeros(len(packages), dtype=RECORD)
+    for record, (workout_type, data) in zip(records, packages):
+        if len(data) > MAX_FIELDS:
+            raise ValueError(f'Больше {MAX_FIELDS} полей в пакете')
+        code = workout_type.encode('ascii')
+        if len(code) > CODE_SIZE:
+            raise ValueError(f'Код тренировки длиннее {CODE_SIZE} символов: '
+                             f'{workout_type}')
+        record['code'] = code
+        record['count'] = len(data)
+        record['values'][:len(data)] = data
+    return records
+
+
+def write_packages(path: str,
+                   packages: Iterable[Package],
+                   chunk_size: int = 65536) -> int:
+    """Записать пакеты в двоичный файл. Вернуть число записей."""
+    packages = iter(packages)
+    count = 0
+    with open(path, 'wb') as file:
+        file.write(MAGIC)
+        while True:
+            records = _to_records(islice(packages, chunk_size))
+            if not len(records):
+                return count
+            records.tofile(file)
+            count += len(records)
+
+
+def _json_packages(lines: Iterable[str]) -> Iterator[Package]:
+    """Прочитать пакеты из JSON-строк с полями workout_type и data."""
+    for line in lines:
+        if line.strip():
+            package = json.loads(line)
+            yield package['workout_type'], package['data']
+
+
+def _text_packages(lines: Iterable[str]) -> Iterator[Package]:
+    """Прочитать пакеты из строк вида `SWM 720 1 80 25 40`."""
+    for line in lines:
+        fields = line.split()
+        if fields:
+            yield fields[0], [float(value) for value in fields[1:]]
+
+
+def convert_json_lines(source: TextIO, path: str) -> int:
+    """Перевести поток JSON-строк в двоичный файл."""
+    return write_packages(path, _json_packages(source))
+
+
+def convert_text(source: TextIO, path: str) -> int:
+    """Перевести текстовый поток пакетов в двоичный файл."""
+    return write_packages(path, _text_packages(source))
+
+
+def open_packages(path: str) -> np.ndarray:
+    """Отобразить файл пакетов в память как массив записей."""
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError('Неизвестный формат файла пакетов')
+    return np.memmap(path, dtype=RECORD, mode='r', offset=len(MAGIC))
+
+
+def iter_packages(path: str, chunk_size: int = 65536) -> Iterator[Package]:
+    """Лениво читать пакеты для `read_package_fast`."""
+    records = open_packages(path)
+    for start in range(0, len(records), chunk_size):
+        block = records[start:start + chunk_size]
+        for code, count, values in zip(block['code'].tolist(),
+                                       block['count'].tolist(),
+                                       block['values'].tolist()):
+            yield code.decode('ascii'), tuple(values[:count])
+
+
+def read_columns(path: str,
+                 errors: Optional[List[int]] = None) -> Dict[str, Columns]:
+    """Сгруппировать значения полей по типам тренировок.
+
+    Записи, у которых число полей не совпадает с `FIELDS` класса,
+    вызывают `ValueError`; если передан список `errors`, их номера
+    добавляются в него, а записи пропускаются.
+    """
+    records = open_packages(path)
+    columns = {}
+    for code in np.unique(records['code']).tolist():
+        workout_type = code.decode('ascii')
+        fields = get_workout(workout_type).FIELDS
+        selected = records['code'] == code
+        broken = selected & (records['count'] != len(fields))
+        if broken.any():
+            if errors is None:
+                raise ValueError(f'Число полей записи '
+                                 f'{np.flatnonzero(broken)[0]} не '
+                                 f'совпадает с {workout_type}')
+            errors.extend(np.flatnonzero(broken).tolist())
+            selected &= ~broken
+        values = records['values'][selected]
+        columns[workout_type] = {
+            name: values[:, i] for i, name in enumerate(fields)}
+    return columns
+
+
+def compute_file(path: str,
+                 errors: Optional[List[int]] = None) -> Dict[str, Columns]:
+    """Рассчитать показатели для всех записей файла по типам."""
+    return {workout_type: compute_batch(workout_type, columns)
+            for workout_type, columns in read_columns(path, errors).items()}
@@ -0,0 +1,59 @@
+"""Кэш сообщений о повторяющихся тренировках."""
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from homework import InfoMessage, read_package
+
+
+class MessageCache:
+    """LRU-кэш готовых строк `InfoMessage.get_message`.
+
+    Ключом служат либо исходные данные пакета, либо поля
+    `InfoMessage`. При переполнении вытесняется давно не
+    использованная запись.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError('Размер кэша должен быть положительным')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: Hashable, compute: Callable[[], str]) -> str:
+        """Вернуть значение из кэша или вычислить и сохранить его."""
+        try:
+            message = self._data[key]
+        except KeyError:
+            self.misses += 1
+            message = self._data[key] = compute()
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return message
+        self.hits += 1
+        self._data.move_to_end(key)
+        return message
+
+    def get_package_message(self, workout_type: str, data: list) -> str:
+        """Получить сообщение по пакету, минуя расчёт и форматирование."""
+        return self._lookup(
+            (workout_type, tuple(data)),
+            lambda: read_package(workout_type, data)
+            .show_training_info().get_message())
+
+    def get_message(self, info: InfoMessage) -> str:
+        """Получить сообщение по `InfoMessage`, минуя форматирование."""
+        return self._lookup(
+            (info.training_type, info.duration, info.distance,
+             info.speed, info.calories),
+            info.get_message)
+
+    def clear(self) -> None:
+        """Очистить кэш и счётчики."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,131 @@
+"""Колоночная выгрузка `InfoMessage` в сжатые файлы.
+
+Файл начинается с сигнатуры `MAGIC`, за ней идут блоки до `chunk_rows`
+строк. Блок состоит из длины заголовка (4 байта), JSON-заголовка и
+сжатых zlib колонок. `training_type` кодируется словарём блока в
+номера uint8 (uint16 при большом словаре), числовые поля хранятся как
+float64 без потери точности. Читатель разжимает только запрошенные
+колонки, остальные пропускает.
+"""
+import json
+import struct
+import zlib
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from homework import InfoMessage
+
+MAGIC = b'TRKCOL01'
+HEADER = struct.Struct('<I')
+FIELDS = ('training_type', 'duration', 'distance', 'speed', 'calories')
+NUMERIC_FIELDS = FIELDS[1:]
+
+
+class ColumnarWriter:
+    """Запись сообщений блоками в колоночный файл."""
+
+    def __init__(self, path: str, chunk_rows: int = 65536,
+                 level: int = 6) -> None:
+        if chunk_rows < 1:
+            raise ValueError('Размер блока должен быть положительным')
+        self.chunk_rows = chunk_rows
+        self.level = level
+        self.count = 0
+        self._file: BinaryIO = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._rows: List[InfoMessage] = []
+
+    def write(self, info: InfoMessage) -> None:
+        """Добавить одно сообщение."""
+        self._rows.append(info)
+        if len(self._rows) >= self.chunk_rows:
+            self.flush()
+
+    def write_all(self, infos: Iterable[InfoMessage]) -> int:
+        """Добавить все сообщения и вернуть общее число записанных."""
+        for info in infos:
+            self.write(info)
+        self.flush()
+        return self.count
+
+    def flush(self) -> None:
+        """Записать накопленные строки отдельным блоком."""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+        dictionary: Dict[str, int] = {}
+        codes = [dictionary.setdefault(info.training_type, len(dictionary))
+                 for info in rows]
+        arrays = {'training_type': np.array(
+            codes, dtype=np.uint8 if len(dictionary) <= 256 else '<u2')}
+        for name in NUMERIC_FIELDS:
+            arrays[name] = np.fromiter(
+                (getattr(info, name) for info in rows), dtype='<f8',
+                count=len(rows))
+        blocks, columns, offset = [], {}, 0
+        for name, array in arrays.items():
+            block = zlib.compress(array.tobytes(), self.level)
+            columns[name] = [offset, len(block), array.dtype.str]
+            blocks.append(block)
+            offset += len(block)
+        header = json.dumps({'rows': len(rows),
+                             'dictionary': list(dictionary),
+                             'columns': columns}).encode()
+        self._file.write(HEADER.pack(len(header)))
+        self._file.write(header)
+        self._file.write(b''.join(blocks))
+        self.count += len(rows)
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> 'ColumnarWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def iter_chunks(path: str, columns: Optional[Iterable[str]] = None
+                ) -> Iterator[Dict[str, np.ndarray]]:
+    """Лениво читать блоки, разжимая только колонки `columns`."""
+    columns = FIELDS if columns is None else tuple(columns)
+    unknown = set(columns) - set(FIELDS)
+    if unknown:
+        raise ValueError(
+            f'Неизвестные колонки: {", ".join(sorted(unknown))}')
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError('Неизвестный формат колоночного файла')
+        while True:
+            size = file.read(HEADER.size)
+            if not size:
+                return
+            header = json.loads(file.read(HEADER.unpack(size)[0]))
+            start = file.tell()
+            chunk = {}
+            for name in columns:
+                offset, length, dtype = header['columns'][name]
+                file.seek(start + offset)
+                array = np.frombuffer(
+                    zlib.decompress(file.read(length)), dtype=dtype)
+                if name == 'training_type':
+                    array = np.array(header['dictionary'])[array]
+                chunk[name] = array
+            file.seek(start + sum(
+                length for _, length, _ in header['columns'].values()))
+            yield chunk
+
+
+def load(path: str,
+         columns: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+    """Загрузить выбранные колонки всего файла."""
+    columns = FIELDS if columns is None else tuple(columns)
+    parts: Dict[str, list] = {name: [] for name in columns}
+    for chunk in iter_chunks(path, columns):
+        for name, array in chunk.items():
+            parts[name].append(array)
+    return {name: np.concatenate(arrays) if arrays else np.empty(0)
+            for name, arrays in parts.items()}
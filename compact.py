@@ -0,0 +1,142 @@
+"""Компактные варианты тренировок и сообщений без `__dict__`.
+
+Классы повторяют публичные атрибуты и методы из `homework`, включая
+`FIELDS`, свёрнутые `CALORIE_COEFFS` и `from_tuple`, но хранят данные
+в `__slots__`, поэтому занимают заметно меньше памяти при хранении
+миллионов записей. В `homework.WORKOUT_TYPES` они не регистрируются:
+коды тренировок там по-прежнему означают классы `homework`.
+"""
+from dataclasses import dataclass
+from typing import Dict, Type
+
+import homework
+
+
+@dataclass
+class InfoMessage:
+    """Информационное сообщение о тренировке."""
+    __slots__ = ('training_type', 'duration', 'distance', 'speed',
+                 'calories')
+    training_type: str
+    duration: float
+    distance: float
+    speed: float
+    calories: float
+
+    get_message = homework.InfoMessage.get_message
+
+
+class Training:
+    """Базовый класс тренировки."""
+    __slots__ = ('action', 'duration', 'weight')
+    LEN_STEP = homework.Training.LEN_STEP
+    M_IN_KM = homework.Training.M_IN_KM
+    H_IN_MIN = homework.Training.H_IN_MIN
+    FIELDS = homework.Training.FIELDS
+    CALORIE_COEFFS = homework.Training.CALORIE_COEFFS
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.from_tuple = staticmethod(homework._tuple_constructor(cls))
+        cls.CALORIE_COEFFS = cls.fold_calorie_constants()
+
+    def __init__(self,
+                 action: int,
+                 duration: float,
+                 weight: float) -> None:
+        self.action = action
+        self.duration = duration
+        self.weight = weight
+
+    get_distance = homework.Training.get_distance
+    get_mean_speed = homework.Training.get_mean_speed
+    get_spent_calories = homework.Training.get_spent_calories
+    fold_calorie_constants = (
+        homework.Training.__dict__['fold_calorie_constants'])
+    calories_formula = homework.Training.__dict__['calories_formula']
+
+    def show_training_info(self) -> InfoMessage:
+        """Вернуть информационное сообщение о выполненной тренировке."""
+        return InfoMessage(self.__class__.__name__, self.duration,
+                           self.get_distance(), self.get_mean_speed(),
+                           self.get_spent_calories())
+
+
+class Running(Training):
+    """Тренировка: бег."""
+    __slots__ = ()
+    CALORIES_MEAN_SPEED_MULTIPLIER = (
+        homework.Running.CALORIES_MEAN_SPEED_MULTIPLIER)
+    CALORIES_MEAN_SPEED_SHIFT = homework.Running.CALORIES_MEAN_SPEED_SHIFT
+
+    fold_calorie_constants = (
+        homework.Running.__dict__['fold_calorie_constants'])
+    calories_formula = homework.Running.__dict__['calories_formula']
+
+
+class SportsWalking(Training):
+    """Тренировка: спортивная ходьба."""
+    __slots__ = ('height',)
+    FIELDS = homework.SportsWalking.FIELDS
+    KMH_IN_MS = homework.SportsWalking.KMH_IN_MS
+    M_IN_SM = homework.SportsWalking.M_IN_SM
+    FIRST_COEFF = homework.SportsWalking.FIRST_COEFF
+    SECOND_COEFF = homework.SportsWalking.SECOND_COEFF
+
+    def __init__(self,
+                 action,
+                 duration,
+                 weight,
+                 height: int):
+        super().__init__(action, duration, weight)
+        self.height = height
+
+    fold_calorie_constants = (
+        homework.SportsWalking.__dict__['fold_calorie_constants'])
+    calories_formula = homework.SportsWalking.__dict__['calories_formula']
+
+
+class Swimming(Training):
+    """Тренировка: плавание."""
+    __slots__ = ('length_pool', 'count_pool')
+    FIELDS = homework.Swimming.FIELDS
+    FIRST_COEFF = homework.Swimming.FIRST_COEFF
+    SECOND_COEFF = homework.Swimming.SECOND_COEFF
+    LEN_STEP = homework.Swimming.LEN_STEP
+
+    def __init__(self,
+                 action,
+                 duration,
+                 weight,
+                 length_pool: int,
+                 count_pool: int
+                 ):
+        super().__init__(action, duration, weight)
+        self.length_pool = length_pool
+        self.count_pool = count_pool
+
+    get_mean_speed = homework.Swimming.get_mean_speed
+    fold_calorie_constants = (
+        homework.Swimming.__dict__['fold_calorie_constants'])
+    calories_formula = homework.Swimming.__dict__['calories_formula']
+
+
+Training.from_tuple = staticmethod(homework._tuple_constructor(Training))
+
+WORKOUT_TYPES: Dict[str, Type[Training]] = {'SWM': Swimming,
+                                            'RUN': Running,
+                                            'WLK': SportsWalking}
+
+
+def read_package(workout_type: str, data: list) -> Training:
+    """Прочитать данные датчиков в компактную тренировку."""
+    if workout_type not in WORKOUT_TYPES:
+        raise ValueError('Недоступная тренировка')
+    return WORKOUT_TYPES[workout_type](*data)
+
+
+def read_package_fast(workout_type: str, values: tuple) -> Training:
+    """Прочитать проверенный кортеж значений FIELDS без распаковки."""
+    if workout_type not in WORKOUT_TYPES:
+        raise ValueError('Недоступная тренировка')
+    return WORKOUT_TYPES[workout_type].from_tuple(values)
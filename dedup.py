@@ -0,0 +1,40 @@
+"""Пакетный расчёт с объединением одинаковых пакетов.
+
+Устройства часто присылают одни и те же наборы значений. Одинаковые
+пары (код тренировки, данные) считаются один раз, а результат
+раскладывается обратно в исходном порядке. Повторы получают один и тот
+же объект `InfoMessage`, поэтому менять его на месте нельзя.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from homework import InfoMessage, read_package
+
+Package = Tuple[str, list]
+
+
+class DedupResult(NamedTuple):
+    """Сообщения в исходном порядке и число уникальных пакетов."""
+    infos: List[InfoMessage]
+    unique: int
+
+    @property
+    def ratio(self) -> float:
+        """Во сколько раз пакетов больше, чем уникальных расчётов."""
+        return len(self.infos) / self.unique if self.unique else 1.0
+
+
+def compute_deduplicated(packages: Iterable[Package]) -> DedupResult:
+    """Посчитать `InfoMessage` для пакетов, объединив повторы."""
+    slots: Dict[tuple, int] = {}
+    unique: List[Tuple[str, tuple]] = []
+    order: List[int] = []
+    for workout_type, data in packages:
+        key = (workout_type, tuple(data))
+        slot = slots.get(key)
+        if slot is None:
+            slot = slots[key] = len(unique)
+            unique.append(key)
+        order.append(slot)
+    infos = [read_package(workout_type, data).show_training_info()
+             for workout_type, data in unique]
+    return DedupResult([infos[slot] for slot in order], len(unique))
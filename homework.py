@@ -1,4 +1,9 @@
+import operator
+import threading
 from dataclasses import dataclass
+from importlib import import_module
+from keyword import iskeyword
+from typing import Callable, Dict, Type
 
 
 @dataclass
@@ -18,11 +23,132 @@ class InfoMessage:
                 f'Потрачено ккал: {self.calories:.3f}.')
 
 
+WORKOUT_TYPES: Dict[str, Type['Training']] = {}
+
+
+def register_workout(code: str) -> Callable[[type], type]:
+    """Зарегистрировать класс тренировки под кодом из пакета."""
+    def decorator(cls: type) -> type:
+        WORKOUT_TYPES[code] = cls
+        return cls
+    return decorator
+
+
+ENTRY_POINT_GROUP = 'homework.workouts'
+LAZY_WORKOUTS: Dict[str, str] = {}
+_entry_points_loaded = False
+_entry_points_lock = threading.Lock()
+
+
+def register_lazy_workout(code: str, target: str) -> None:
+    """Зарегистрировать тренировку `module:Class` без импорта модуля.
+
+    Модуль импортируется при первом обращении к коду тренировки.
+    """
+    LAZY_WORKOUTS[code] = target
+
+
+def _load_entry_points() -> None:
+    """Добавить в LAZY_WORKOUTS тренировки из точек входа пакетов.
+
+    Флаг ставится только после просмотра, а сам просмотр идёт под
+    блокировкой: другой поток дождётся его конца и увидит все коды.
+    """
+    global _entry_points_loaded
+    with _entry_points_lock:
+        if _entry_points_loaded:
+            return
+        from importlib.metadata import entry_points
+        try:
+            points = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            points = entry_points().get(ENTRY_POINT_GROUP, ())
+        for point in points:
+            LAZY_WORKOUTS.setdefault(point.name, point.value)
+        _entry_points_loaded = True
+
+
+def get_workout(code: str) -> Type['Training']:
+    """Получить класс тренировки, при необходимости загрузив плагин.
+
+    Неизвестный код и плагин, который не удалось импортировать, дают
+    одну и ту же `ValueError`.
+    """
+    if code in WORKOUT_TYPES:
+        return WORKOUT_TYPES[code]
+    if code not in LAZY_WORKOUTS and not _entry_points_loaded:
+        _load_entry_points()
+    if code not in LAZY_WORKOUTS:
+        raise ValueError('Недоступная тренировка')
+    module_name, _, name = LAZY_WORKOUTS[code].partition(':')
+    try:
+        cls = getattr(import_module(module_name), name)
+    except (ImportError, AttributeError) as error:
+        raise ValueError('Недоступная тренировка') from error
+    WORKOUT_TYPES.setdefault(code, cls)
+    return WORKOUT_TYPES[code]
+
+
+def _construct(cls: type, values: tuple) -> 'Training':
+    return cls(*values)
+
+
+def _first_from_tuple(cls: type, values: tuple) -> 'Training':
+    """Создать тренировку из проверенного кортежа значений FIELDS.
+
+    Первый вызов собирает объект конструктором и, если `__init__`
+    лишь сохранил значения в порядке FIELDS, заменяет `from_tuple`
+    класса на `_tuple_constructor`; иначе — на вызов конструктора.
+    Наследники получают свою проверку, а не метод родителя.
+    """
+    training = cls(*values)
+    if _stores_fields(training, values):
+        cls.from_tuple = staticmethod(_tuple_constructor(cls))
+    else:
+        cls.from_tuple = classmethod(_construct)
+    return training
+
+
+def _stores_fields(training: 'Training', values: tuple) -> bool:
+    """Проверить, что `__init__` только сохранил значения FIELDS."""
+    fields = vars(training)
+    return (tuple(fields) == tuple(training.FIELDS)
+            and all(map(str.isidentifier, fields))
+            and not any(map(iskeyword, fields))
+            and all(map(operator.is_, fields.values(), values)))
+
+
+def _tuple_constructor(cls: type) -> Callable[[tuple], 'Training']:
+    """Собрать конструктор класса из кортежа без распаковки аргументов.
+
+    Код функции строится по FIELDS: объект создаётся `object.__new__`,
+    а поля записываются распаковкой кортежа в атрибуты в том же
+    порядке, что и в `__init__`, поэтому раскладка атрибутов объекта
+    не отличается от созданного конструктором.
+    """
+    targets = ''.join(f'training.{name}, ' for name in cls.FIELDS)
+    source = (f'def from_tuple(values):\n'
+              f'    training = new(cls)\n'
+              f'    {targets}= values\n'
+              f'    return training\n')
+    namespace = {'new': object.__new__, 'cls': cls}
+    exec(source, namespace)
+    return namespace['from_tuple']
+
+
 class Training:
     """Базовый класс тренировки."""
     LEN_STEP = 0.65
     M_IN_KM = 1000
     H_IN_MIN = 60
+    FIELDS = ('action', 'duration', 'weight')
+    CALORIE_COEFFS: tuple = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if 'from_tuple' not in vars(cls):
+            cls.from_tuple = classmethod(_first_from_tuple)
+        cls.CALORIE_COEFFS = cls.fold_calorie_constants()
 
     def __init__(self,
                  action: int,
@@ -32,6 +158,8 @@ class Training:
         self.duration = duration
         self.weight = weight
 
+    from_tuple = classmethod(_first_from_tuple)
+
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
         return self.action * self.LEN_STEP / self.M_IN_KM
@@ -42,6 +170,22 @@ class Training:
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
+        return self.calories_formula(self.CALORIE_COEFFS,
+                                     self.get_mean_speed(), self)
+
+    @classmethod
+    def fold_calorie_constants(cls) -> tuple:
+        """Свернуть константы формулы калорий в коэффициенты."""
+        return ()
+
+    @staticmethod
+    def calories_formula(coeffs: tuple, speed, fields):
+        """Калории по свёрнутым коэффициентам.
+
+        Единственная запись формулы класса. Поля читаются атрибутами
+        `fields`: это сама тренировка или колонки массивов, поэтому
+        формула работает и для одного объекта, и для пакета.
+        """
         pass
 
     def show_training_info(self) -> InfoMessage:
@@ -51,23 +195,32 @@ class Training:
                            self.get_spent_calories())
 
 
+@register_workout('RUN')
 class Running(Training):
     """Тренировка: бег."""
     CALORIES_MEAN_SPEED_MULTIPLIER = 18
     CALORIES_MEAN_SPEED_SHIFT = 1.79
 
-    def get_spent_calories(self) -> float:
-        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER * super().get_mean_speed()
-                + self.CALORIES_MEAN_SPEED_SHIFT)
-                * self.weight / self.M_IN_KM * (self.duration * self.H_IN_MIN))
+    @classmethod
+    def fold_calorie_constants(cls) -> tuple:
+        scale = cls.H_IN_MIN / cls.M_IN_KM
+        return (cls.CALORIES_MEAN_SPEED_MULTIPLIER * scale,
+                cls.CALORIES_MEAN_SPEED_SHIFT * scale)
+
+    @staticmethod
+    def calories_formula(coeffs: tuple, speed, fields):
+        return ((coeffs[0] * speed + coeffs[1])
+                * fields.weight * fields.duration)
 
 
+@register_workout('WLK')
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
     KMH_IN_MS = 0.278
     M_IN_SM = 100
     FIRST_COEFF = 0.035
     SECOND_COEFF = 0.029
+    FIELDS = Training.FIELDS + ('height',)
 
     def __init__(self,
                  action,
@@ -77,19 +230,25 @@ class SportsWalking(Training):
         super().__init__(action, duration, weight)
         self.height = height
 
-    def get_spent_calories(self) -> float:
-        return ((self.FIRST_COEFF * self.weight
-                + (((super().get_mean_speed())
-                 * self.KMH_IN_MS)**2 / (self.height / self.M_IN_SM))
-                * self.SECOND_COEFF * self.weight)
-                * (self.duration * self.H_IN_MIN))
+    @classmethod
+    def fold_calorie_constants(cls) -> tuple:
+        return (cls.FIRST_COEFF * cls.H_IN_MIN,
+                cls.KMH_IN_MS ** 2 * cls.M_IN_SM * cls.SECOND_COEFF
+                * cls.H_IN_MIN)
 
+    @staticmethod
+    def calories_formula(coeffs: tuple, speed, fields):
+        return ((coeffs[0] + coeffs[1] * speed * speed / fields.height)
+                * fields.weight * fields.duration)
 
+
+@register_workout('SWM')
 class Swimming(Training):
     """Тренировка: плавание."""
     FIRST_COEFF = 1.1
     SECOND_COEFF = 2
     LEN_STEP = 1.38
+    FIELDS = Training.FIELDS + ('length_pool', 'count_pool')
 
     def __init__(self,
                  action,
@@ -107,19 +266,32 @@ class Swimming(Training):
         return (self.length_pool * self.count_pool
                 / self.M_IN_KM / self.duration)
 
-    def get_spent_calories(self) -> float:
-        return ((self.get_mean_speed() + self.FIRST_COEFF)
-                * self.SECOND_COEFF * self.weight * self.duration)
+    @classmethod
+    def fold_calorie_constants(cls) -> tuple:
+        return (cls.SECOND_COEFF, cls.FIRST_COEFF * cls.SECOND_COEFF)
+
+    @staticmethod
+    def calories_formula(coeffs: tuple, speed, fields):
+        return ((coeffs[0] * speed + coeffs[1])
+                * fields.weight * fields.duration)
 
 
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    workout: dict = {'SWM': Swimming,
-                     'RUN': Running,
-                     'WLK': SportsWalking}
-    if workout_type not in workout.keys():
-        raise ValueError('Недоступная тренировка')
-    return workout[workout_type](*data)
+    if workout_type not in WORKOUT_TYPES:
+        return get_workout(workout_type)(*data)
+    return WORKOUT_TYPES[workout_type](*data)
+
+
+def read_package_fast(workout_type: str, values: tuple) -> Training:
+    """Прочитать заранее проверенный кортеж значений FIELDS.
+
+    Объект собирает `from_tuple` класса, без распаковки аргументов
+    в `__init__`.
+    """
+    if workout_type not in WORKOUT_TYPES:
+        return get_workout(workout_type).from_tuple(values)
+    return WORKOUT_TYPES[workout_type].from_tuple(values)
 
 
 def main(training: Training) -> None:
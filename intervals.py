@@ -0,0 +1,53 @@
+"""Разбиение длинной тренировки на интервалы.
+
+Датчик присылает накопленные значения (`action`, для плавания ещё и
+`count_pool`) в моменты времени `times`. Разности соседних отсчётов
+дают значения каждого интервала, а длительность интервала берётся из
+разности времени; остальные поля постоянны для всей сессии. Показатели
+всех интервалов считаются одним вызовом `compute_batch` по формулам
+классов, без создания объекта на каждый интервал.
+"""
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from batch import Columns, compute_batch
+from homework import get_workout
+
+
+def split_intervals(workout_type: str,
+                    times: Sequence[float],
+                    samples: Mapping[str, Sequence[float]],
+                    **constants: float) -> Columns:
+    """Посчитать дистанцию, скорость и калории по интервалам.
+
+    `times` — строго возрастающие моменты отсчётов в часах от начала
+    сессии, `samples` — накопленные значения полей на эти моменты,
+    `constants` — значения остальных полей, кроме `duration`. Калории
+    интервалов в сумме не обязаны совпадать с калориями всей сессии:
+    формулы нелинейны по скорости.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if times.ndim != 1 or len(times) < 2:
+        raise ValueError('Нужно минимум два отсчёта времени')
+    if not np.all(np.diff(times) > 0):
+        raise ValueError('Моменты отсчётов должны строго возрастать')
+    size = len(times) - 1
+    columns = {}
+    for name in get_workout(workout_type).FIELDS:
+        if name == 'duration':
+            columns[name] = np.diff(times)
+        elif name in samples:
+            values = np.asarray(samples[name], dtype=np.float64)
+            if values.shape != times.shape:
+                raise ValueError(f'Число отсчётов {name} не совпадает '
+                                 'с числом отсчётов времени')
+            columns[name] = np.diff(values)
+        elif name in constants:
+            columns[name] = np.full(size, constants[name], dtype=np.float64)
+        else:
+            raise ValueError(f'Не передано поле {name}')
+    result = compute_batch(workout_type, columns)
+    result['start'] = times[:-1]
+    result['end'] = times[1:]
+    return result
@@ -0,0 +1,160 @@
+"""Генератор нагрузки и замер пропускной способности.
+
+Генератор выдаёт детерминированный по `seed` поток пакетов с заданной
+долей типов тренировок и правдоподобными значениями: вес, рост,
+длительность и скорость берутся из нормальных и логнормальных
+распределений, а шаги, гребки и число бассейнов выводятся из скорости.
+Поток проходит `read_package`, `show_training_info` и `get_message`;
+время каждого этапа каждой записи сохраняется в `array('q')` (8 байт
+на запись и этап), и перцентили считаются по этим значениям точно.
+Скорость выводится дважды: по сумме времени этапов и по настенному
+времени всего прогона вместе с генерацией и циклом.
+
+Запуск: python loadgen.py --count 1000000 --mix RUN=60,WLK=25,SWM=15
+"""
+import argparse
+import math
+import random
+from array import array
+import resource
+import sys
+import time
+from typing import Dict, Iterator, Mapping, Sequence, Tuple
+
+from homework import (Running, SportsWalking, Swimming, Training,
+                      read_package)
+
+Package = Tuple[str, list]
+
+DEFAULT_MIX = {'RUN': 50, 'WLK': 30, 'SWM': 20}
+STAGES = ('read_package', 'show_training_info', 'get_message')
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def _clip(value: float, low: float, high: float) -> float:
+    return min(max(value, low), high)
+
+
+def _running(rng: random.Random, duration: float, weight: float) -> list:
+    speed = _clip(rng.gauss(10, 2), 5, 20)
+    return [round(speed * duration * Training.M_IN_KM / Running.LEN_STEP),
+            duration, weight]
+
+
+def _sports_walking(rng: random.Random, duration: float,
+                    weight: float) -> list:
+    speed = _clip(rng.gauss(5.5, 1), 3, 9)
+    height = round(_clip(rng.gauss(172, 9), 140, 210))
+    steps = round(speed * duration * Training.M_IN_KM
+                  / SportsWalking.LEN_STEP)
+    return [steps, duration, weight, height]
+
+
+def _swimming(rng: random.Random, duration: float, weight: float) -> list:
+    speed = _clip(rng.gauss(2.5, 0.6), 1, 5)
+    length_pool = rng.choices((25, 50), (3, 1))[0]
+    count_pool = max(1, round(speed * duration * Training.M_IN_KM
+                              / length_pool))
+    strokes = round(count_pool * length_pool / Swimming.LEN_STEP)
+    return [strokes, duration, weight, length_pool, count_pool]
+
+
+GENERATORS = {'RUN': _running, 'WLK': _sports_walking, 'SWM': _swimming}
+
+
+def generate_packages(count: int, seed: int = 0,
+                      mix: Mapping[str, float] = DEFAULT_MIX
+                      ) -> Iterator[Package]:
+    """Лениво выдать `count` пакетов с долями типов из `mix`."""
+    unknown = set(mix) - set(GENERATORS)
+    if unknown:
+        raise ValueError(f'Нет генератора для {", ".join(sorted(unknown))}')
+    rng = random.Random(seed)
+    codes = list(mix)
+    weights = list(mix.values())
+    for _ in range(count):
+        code = rng.choices(codes, weights)[0]
+        duration = round(_clip(rng.lognormvariate(0, 0.4), 0.25, 4), 2)
+        weight = round(_clip(rng.gauss(75, 12), 40, 150), 1)
+        yield code, GENERATORS[code](rng, duration, weight)
+
+
+def _peak_rss_kb() -> float:
+    """Пиковый RSS процесса в КиБ; на macOS `ru_maxrss` в байтах."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+
+def run_load(packages: Iterator[Package]) -> dict:
+    """Прогнать пакеты через этапы и собрать показатели."""
+    timings: Dict[str, array] = {stage: array('q') for stage in STAGES}
+    read, show, message = (timings[stage].append for stage in STAGES)
+    clock = time.perf_counter_ns
+    count = 0
+    busy = 0
+    began = clock()
+    for workout_type, data in packages:
+        start = clock()
+        training = read_package(workout_type, data)
+        built = clock()
+        info = training.show_training_info()
+        computed = clock()
+        info.get_message()
+        end = clock()
+        read(built - start)
+        show(computed - built)
+        message(end - computed)
+        busy += end - start
+        count += 1
+    wall = clock() - began
+    return {'count': count,
+            'records_per_second': count / busy * 1e9 if busy else 0.0,
+            'wall_records_per_second': count / wall * 1e9 if wall else 0.0,
+            'peak_rss_kb': _peak_rss_kb(),
+            'timings': timings}
+
+
+def percentile(ordered: Sequence[int], share: float) -> int:
+    """Перцентиль отсортированных значений по ближайшему рангу."""
+    if not ordered:
+        return 0
+    return ordered[max(math.ceil(len(ordered) * share), 1) - 1]
+
+
+def format_report(report: dict) -> str:
+    """Текстовый отчёт о прогоне."""
+    lines = [f'записей: {report["count"]}',
+             f'записей/с по этапам: {report["records_per_second"]:,.0f}',
+             'записей/с по настенному времени: '
+             f'{report["wall_records_per_second"]:,.0f}',
+             f'пиковый RSS: {report["peak_rss_kb"] / 1024:.1f} МиБ',
+             f'{"этап":<20}' + ''.join(
+                 f'{f"p{share * 100:g}, нс":>12}' for share in QUANTILES)]
+    for stage, values in report['timings'].items():
+        ordered = sorted(values)
+        lines.append(f'{stage:<20}' + ''.join(
+            f'{percentile(ordered, share):>12}' for share in QUANTILES))
+    return '\n'.join(lines)
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Разобрать доли вида `RUN=60,WLK=25,SWM=15`."""
+    mix = {}
+    for part in text.split(','):
+        code, _, share = part.partition('=')
+        try:
+            mix[code.strip()] = float(share)
+        except ValueError:
+            raise ValueError(f'Некорректная доля: {part}') from None
+    return mix
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help='доли типов, например RUN=60,WLK=25,SWM=15')
+    args = parser.parse_args()
+    print(format_report(run_load(
+        generate_packages(args.count, args.seed, args.mix))))
@@ -0,0 +1,122 @@
+"""Разбор текстовых пакетов вида `SWM 720 1 80 25 40`.
+
+Каждая строка проверяется за один проход: код тренировки, число полей,
+числовой формат и допустимые значения. Ошибочные строки не прерывают
+поток, а попадают в список ошибок с номером строки и позицией.
+"""
+import math
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from homework import WORKOUT_TYPES, get_workout
+
+UNKNOWN_WORKOUT = 'unknown_workout'
+FIELD_COUNT = 'field_count'
+NOT_A_NUMBER = 'not_a_number'
+OUT_OF_RANGE = 'out_of_range'
+
+POSITIVE_FIELDS = frozenset(('duration', 'weight', 'height', 'length_pool'))
+
+Package = Tuple[str, tuple]
+
+
+class ParseError(NamedTuple):
+    """Ошибка в строке пакета."""
+    line: int
+    column: int
+    reason: str
+    text: str
+
+
+def check_values(workout_type: str,
+                 values: tuple) -> Optional[Tuple[str, int]]:
+    """Проверить пакет без создания тренировки.
+
+    Возвращает код причины и индекс поля (-1 для всего пакета) или
+    `None`, если пакет корректен. Поля из `POSITIVE_FIELDS` должны быть
+    больше нуля — на них делят формулы, — остальные неотрицательны.
+    """
+    try:
+        cls = get_workout(workout_type)
+    except ValueError:
+        return UNKNOWN_WORKOUT, -1
+    fields = cls.FIELDS
+    if len(values) != len(fields):
+        return FIELD_COUNT, -1
+    for index, (name, value) in enumerate(zip(fields, values)):
+        if not math.isfinite(value) or value < 0 or (
+                value == 0 and name in POSITIVE_FIELDS):
+            return OUT_OF_RANGE, index
+    return None
+
+
+def _rules(workout_type: str) -> Optional[Tuple[int, Tuple[int, ...]]]:
+    """Число полей и индексы строго положительных полей для типа."""
+    try:
+        cls = get_workout(workout_type)
+    except ValueError:
+        return None
+    return len(cls.FIELDS), tuple(
+        index for index, name in enumerate(cls.FIELDS)
+        if name in POSITIVE_FIELDS)
+
+
+def _column(text: str, token: int) -> int:
+    """Позиция (с 1) токена с номером `token` в строке."""
+    position = 0
+    for _ in range(token + 1):
+        while text[position].isspace():
+            position += 1
+        start = position
+        while position < len(text) and not text[position].isspace():
+            position += 1
+    return start + 1
+
+
+def parse_lines(lines: Iterable[str],
+                errors: Optional[List[ParseError]] = None
+                ) -> Iterator[Package]:
+    """Лениво разобрать строки в пакеты `(код, значения)`.
+
+    Пустые строки пропускаются. Ошибки добавляются в `errors`, если
+    список передан, и разбор продолжается со следующей строки.
+    Корректные строки проходят дешёвые проверки по заранее собранным
+    правилам; причину ошибки ищет полная `check_values`.
+    """
+    rules = {code: _rules(code) for code in WORKOUT_TYPES}
+    isfinite = math.isfinite
+    for number, text in enumerate(lines, 1):
+        tokens = text.split()
+        if not tokens:
+            continue
+        workout_type = tokens[0]
+        try:
+            values = tuple(map(float, tokens[1:]))
+        except ValueError:
+            if errors is not None:
+                token = next(i for i, token in enumerate(tokens[1:], 1)
+                             if not _is_number(token))
+                errors.append(ParseError(number, _column(text, token),
+                                         NOT_A_NUMBER, text))
+            continue
+        rule = rules.get(workout_type)
+        if (rule is not None and len(values) == rule[0]
+                and min(values) >= 0 and isfinite(sum(values))
+                and all(values[index] for index in rule[1])):
+            yield workout_type, values
+            continue
+        problem = check_values(workout_type, values)
+        if problem is None:
+            rules[workout_type] = _rules(workout_type)
+            yield workout_type, values
+        elif errors is not None:
+            reason, index = problem
+            errors.append(ParseError(number, _column(text, index + 1),
+                                     reason, text))
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
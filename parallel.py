@@ -0,0 +1,50 @@
+"""Параллельная обработка пакетов на нескольких ядрах."""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from homework import read_package
+
+Package = Tuple[str, list]
+
+
+def _process_chunk(chunk: List[Package]) -> List[str]:
+    """Обработать блок пакетов в рабочем процессе."""
+    return [read_package(workout_type, data).show_training_info()
+            .get_message() for workout_type, data in chunk]
+
+
+def chunked(packages: Iterable[Package],
+            chunk_size: int) -> Iterator[List[Package]]:
+    """Разбить поток пакетов на блоки по `chunk_size`."""
+    packages = iter(packages)
+    while True:
+        chunk = list(islice(packages, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_parallel(packages: Iterable[Package],
+                 workers: Optional[int] = None,
+                 chunk_size: int = 10_000) -> Iterator[str]:
+    """Посчитать сообщения для пакетов в пуле процессов.
+
+    Пакеты передаются процессам блоками по `chunk_size`, чтобы
+    сократить расходы на сериализацию. Одновременно в работе не больше
+    двух блоков на процесс, а порядок результатов совпадает с порядком
+    входных пакетов.
+    """
+    if chunk_size < 1:
+        raise ValueError('Размер блока должен быть положительным')
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunked(packages, chunk_size):
+            pending.append(executor.submit(_process_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
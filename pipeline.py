@@ -0,0 +1,43 @@
+"""Потоковая обработка пакетов от датчиков."""
+from typing import Iterable, Iterator, Optional, TextIO, Tuple
+
+from homework import InfoMessage, Training, read_package
+from sinks import BulkWriter
+
+Package = Tuple[str, list]
+
+
+def iter_trainings(packages: Iterable[Package]) -> Iterator[Training]:
+    """Лениво превратить пакеты в объекты тренировок."""
+    for workout_type, data in packages:
+        yield read_package(workout_type, data)
+
+
+def iter_info(packages: Iterable[Package]) -> Iterator[InfoMessage]:
+    """Лениво получить информационные сообщения по пакетам."""
+    for training in iter_trainings(packages):
+        yield training.show_training_info()
+
+
+def iter_messages(packages: Iterable[Package]) -> Iterator[str]:
+    """Лениво получить строки сообщений по пакетам."""
+    for info in iter_info(packages):
+        yield info.get_message()
+
+
+def write_messages(messages: Iterable[str],
+                   stream: Optional[TextIO] = None,
+                   chunk_size: int = 1024) -> int:
+    """Записать сообщения блоками по `chunk_size` строк.
+
+    Возвращает количество записанных сообщений.
+    """
+    return BulkWriter(stream, block_size=chunk_size).write_lines(messages)
+
+
+def run(packages: Iterable[Package],
+        stream: Optional[TextIO] = None,
+        chunk_size: int = 1024) -> int:
+    """Обработать поток пакетов и записать результаты."""
+    return BulkWriter(stream, block_size=chunk_size).write_all(
+        iter_info(packages))
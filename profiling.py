@@ -0,0 +1,157 @@
+"""Замеры времени по этапам обработки тренировок.
+
+`Profiler.enable()` оборачивает `read_package`, методы расчёта классов
+из `WORKOUT_TYPES`, `InfoMessage.get_message` и `main`; `disable()`
+возвращает исходные функции. Время этапа включает вложенные вызовы.
+Пока профилировщик выключен, обёрток нет и накладные расходы
+отсутствуют. Обёртка `read_package` действует на вызовы через
+`homework.read_package`, но не на ссылки, полученные через
+`from homework import read_package` до включения.
+"""
+import inspect
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, List, Tuple
+
+import homework
+
+BUCKETS = tuple(10 ** (exponent / 2) for exponent in range(4, 19))
+METHODS = ('get_distance', 'get_mean_speed', 'get_spent_calories',
+           'show_training_info')
+
+UNKNOWN_LABEL = '?'
+
+Key = Tuple[str, str]
+
+
+def _label(label: Callable[..., str], signature: inspect.Signature,
+           args: tuple, kwargs: dict) -> str:
+    """Метка вызова по его аргументам.
+
+    Именованные аргументы приводятся к позиционным через сигнатуру.
+    Если аргументы не подходят к функции или метка не строка,
+    возвращается `UNKNOWN_LABEL`: так исход самого вызова не
+    подменяется, а ключи гистограмм остаются сравнимыми.
+    """
+    try:
+        if kwargs:
+            args = signature.bind(*args, **kwargs).args
+        name = label(*args)
+    except (TypeError, IndexError, AttributeError):
+        return UNKNOWN_LABEL
+    return name if isinstance(name, str) else UNKNOWN_LABEL
+
+
+class Histogram:
+    """Гистограмма длительностей в наносекундах."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0
+
+    def add(self, value: int) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, share: float) -> float:
+        """Верхняя граница корзины, в которую попадает квантиль."""
+        rank = share * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+class Profiler:
+    """Счётчики вызовов и гистограммы времени по этапам и типам."""
+
+    def __init__(self) -> None:
+        self.histograms: Dict[Key, Histogram] = defaultdict(Histogram)
+        self._originals: List[Tuple[object, str, Callable]] = []
+
+    def _wrap(self, owner: object, name: str,
+              label: Callable[..., str]) -> None:
+        original = owner.__dict__[name]
+        histograms = self.histograms
+        clock = time.perf_counter_ns
+        signature = inspect.signature(original)
+
+        @wraps(original)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                key = name, _label(label, signature, args, kwargs)
+                histograms[key].add(clock() - start)
+
+        self._originals.append((owner, name, original))
+        setattr(owner, name, wrapper)
+
+    def enable(self) -> 'Profiler':
+        """Установить обёртки на все этапы."""
+        if self._originals:
+            return self
+        self._wrap(homework, 'read_package', lambda code, *_: code)
+        self._wrap(homework, 'main',
+                   lambda training: type(training).__name__)
+        self._wrap(homework.InfoMessage, 'get_message',
+                   lambda info: info.training_type)
+        classes = {homework.Training, *homework.WORKOUT_TYPES.values()}
+        for cls in classes:
+            for name in METHODS:
+                if name in cls.__dict__:
+                    self._wrap(cls, name,
+                               lambda training: type(training).__name__)
+        return self
+
+    def disable(self) -> None:
+        """Снять обёртки и вернуть исходные функции."""
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def __enter__(self) -> 'Profiler':
+        return self.enable()
+
+    def __exit__(self, *args) -> None:
+        self.disable()
+
+    def reset(self) -> None:
+        """Сбросить накопленные замеры."""
+        self.histograms.clear()
+
+    def summary(self) -> str:
+        """Таблица с числом вызовов и временем по этапам."""
+        lines = [f'{"этап":<20} {"тип":<14} {"вызовов":>9} '
+                 f'{"среднее, нс":>12} {"p50, нс":>10} {"p99, нс":>10}']
+        for (stage, kind), histogram in sorted(self.histograms.items()):
+            lines.append(
+                f'{stage:<20} {kind:<14} {histogram.count:>9} '
+                f'{histogram.total / histogram.count:>12.0f} '
+                f'{histogram.quantile(0.5):>10.0f} '
+                f'{histogram.quantile(0.99):>10.0f}')
+        return '\n'.join(lines)
+
+    def to_prometheus(self, metric: str = 'training_stage_seconds') -> str:
+        """Выгрузить гистограммы в текстовом формате Prometheus."""
+        lines = [f'# TYPE {metric} histogram']
+        for (stage, kind), histogram in sorted(self.histograms.items()):
+            labels = f'stage="{stage}",workout="{kind}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram.counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{labels},'
+                             f'le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} '
+                         f'{histogram.count}')
+            lines.append(f'{metric}_sum{{{labels}}} '
+                         f'{histogram.total / 1e9:g}')
+            lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
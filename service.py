@@ -0,0 +1,171 @@
+"""Асинхронный сервис расчёта тренировок.
+
+Клиент отправляет по одной JSON-строке на пакет:
+`{"workout_type": "RUN", "data": [15000, 1, 75]}` и получает в том же
+порядке строку `{"message": "..."}` или `{"error": "..."}`.
+Запуск: python service.py --port 8765 или python service.py --unix PATH
+"""
+import argparse
+import asyncio
+import json
+from typing import List, Optional, Tuple
+
+from homework import read_package
+
+Request = Tuple[str, list, asyncio.Future]
+BAD_REQUEST = json.dumps({'error': 'Некорректный запрос'},
+                         ensure_ascii=False).encode() + b'\n'
+COMPUTE_FAILED = json.dumps({'error': 'Ошибка расчёта'},
+                            ensure_ascii=False).encode() + b'\n'
+
+
+def _compute(workout_type: str, data: list) -> bytes:
+    """Посчитать ответ для одного пакета."""
+    try:
+        message = read_package(workout_type, data).show_training_info()
+        reply = {'message': message.get_message()}
+    except (ValueError, TypeError, ArithmeticError) as error:
+        reply = {'error': str(error)}
+    return json.dumps(reply, ensure_ascii=False).encode() + b'\n'
+
+
+class TrainingService:
+    """Сервис с микропакетной обработкой и ограниченными очередями.
+
+    Запросы всех соединений попадают в общую очередь размером
+    `queue_size`; когда она заполнена, чтение из сокетов
+    приостанавливается. Обработчик забирает до `max_batch` запросов,
+    ожидая добор не дольше `max_delay` секунд.
+    """
+
+    def __init__(self,
+                 max_batch: int = 256,
+                 max_delay: float = 0.001,
+                 queue_size: int = 4096,
+                 max_pending: int = 1024) -> None:
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue_size = queue_size
+        self.max_pending = max_pending
+        self.processed = 0
+        self.batches = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+
+    async def start(self, host: str = '127.0.0.1',
+                    port: int = 8765) -> asyncio.AbstractServer:
+        """Запустить TCP-сервер."""
+        self._start_batcher()
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Запустить сервер на Unix-сокете."""
+        self._start_batcher()
+        return await asyncio.start_unix_server(self._handle, path)
+
+    async def stop(self) -> None:
+        """Остановить обработчик пакетов."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+    def _start_batcher(self) -> None:
+        if self._batcher is None:
+            self._queue = asyncio.Queue(self.queue_size)
+            self._batcher = asyncio.ensure_future(self._run_batches())
+
+    async def _collect(self) -> List[Request]:
+        """Собрать микропакет запросов из очереди."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run_batches(self) -> None:
+        while True:
+            batch = await self._collect()
+            for workout_type, data, future in batch:
+                if future.cancelled():
+                    continue
+                try:
+                    reply = _compute(workout_type, data)
+                except Exception:
+                    reply = COMPUTE_FAILED
+                future.set_result(reply)
+            self.processed += len(batch)
+            self.batches += 1
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        """Читать запросы соединения и передавать их в очередь."""
+        loop = asyncio.get_running_loop()
+        pending: asyncio.Queue = asyncio.Queue(self.max_pending)
+        replies = asyncio.ensure_future(self._reply(pending, writer))
+        try:
+            async for line in reader:
+                future = loop.create_future()
+                await pending.put(future)
+                try:
+                    package = json.loads(line)
+                    workout_type = package['workout_type']
+                    data = package['data']
+                except (ValueError, KeyError, TypeError):
+                    future.set_result(BAD_REQUEST)
+                    continue
+                await self._queue.put((workout_type, data, future))
+        finally:
+            await pending.put(None)
+            await replies
+
+    @staticmethod
+    async def _reply(pending: asyncio.Queue,
+                     writer: asyncio.StreamWriter) -> None:
+        """Отправлять ответы в порядке поступления запросов."""
+        try:
+            while True:
+                future = await pending.get()
+                if future is None:
+                    break
+                writer.write(await future)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765,
+                unix: Optional[str] = None) -> None:
+    """Запустить сервис и обслуживать клиентов до остановки."""
+    service = TrainingService()
+    if unix is None:
+        server = await service.start(host, port)
+    else:
+        server = await service.start_unix(unix)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='путь к Unix-сокету')
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.unix))
@@ -0,0 +1,121 @@
+"""Блочная запись информационных сообщений о тренировках."""
+import json
+import sys
+from itertools import islice
+from math import isfinite
+from typing import BinaryIO, Callable, Dict, Iterable, Optional, TextIO, Union
+
+from homework import InfoMessage
+
+Stream = Union[TextIO, BinaryIO]
+
+CSV_HEADER = 'training_type,duration,distance,speed,calories'
+
+
+def format_text(info: InfoMessage) -> str:
+    return info.get_message()
+
+
+def format_csv(info: InfoMessage) -> str:
+    return (f'{info.training_type},{info.duration!r},{info.distance!r},'
+            f'{info.speed!r},{info.calories!r}')
+
+
+def format_jsonl(info: InfoMessage) -> str:
+    """Строка JSON; для конечных чисел `repr` совпадает с `json.dumps`."""
+    if not all(map(isfinite, (info.duration, info.distance, info.speed,
+                              info.calories))):
+        raise ValueError('В JSON нельзя записать inf или nan: '
+                         f'{info.training_type}')
+    return (f'{{"training_type": {json.dumps(info.training_type)}, '
+            f'"duration": {info.duration!r}, '
+            f'"distance": {info.distance!r}, '
+            f'"speed": {info.speed!r}, '
+            f'"calories": {info.calories!r}}}')
+
+
+FORMATS: Dict[str, Callable[[InfoMessage], str]] = {
+    'text': format_text,
+    'csv': format_csv,
+    'jsonl': format_jsonl,
+}
+
+
+class BulkWriter:
+    """Запись сообщений в поток крупными блоками.
+
+    Строки накапливаются в буфере и записываются одним вызовом, когда
+    в нём набирается `block_size` строк. Поток может быть текстовым или
+    двоичным (например, `io.BytesIO`): первый блок пишется строкой, и
+    если поток отвечает `TypeError`, этот и следующие блоки кодируются
+    в `encoding`.
+    """
+
+    def __init__(self,
+                 stream: Optional[Stream] = None,
+                 fmt: str = 'text',
+                 block_size: int = 4096,
+                 encoding: str = 'utf-8') -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f'Неизвестный формат вывода: {fmt}')
+        if block_size < 1:
+            raise ValueError('Размер блока должен быть положительным')
+        self.stream = sys.stdout if stream is None else stream
+        self.format = FORMATS[fmt]
+        self.block_size = block_size
+        self.encoding = encoding
+        self.count = 0
+        self._binary: Optional[bool] = None
+        self._lines = [CSV_HEADER] if fmt == 'csv' else []
+
+    def _write(self, text: str) -> None:
+        if self._binary is None:
+            try:
+                self.stream.write(text)
+            except TypeError:
+                self._binary = True
+            else:
+                self._binary = False
+                return
+        if self._binary:
+            self.stream.write(text.encode(self.encoding))
+        else:
+            self.stream.write(text)
+
+    def flush(self) -> None:
+        """Записать накопленные строки."""
+        if self._lines:
+            self._lines.append('')
+            self._write('\n'.join(self._lines))
+            self._lines = []
+        self.stream.flush()
+
+    def write(self, info: InfoMessage) -> None:
+        """Добавить одно сообщение."""
+        self._lines.append(self.format(info))
+        self.count += 1
+        if len(self._lines) >= self.block_size:
+            self.flush()
+
+    def write_lines(self, lines: Iterable[str]) -> int:
+        """Записать готовые строки блоками и вернуть число записанных."""
+        lines = iter(lines)
+        while True:
+            block = list(islice(lines, self.block_size))
+            if not block:
+                break
+            self._lines.extend(block)
+            self.count += len(block)
+            self.flush()
+        self.flush()
+        return self.count
+
+    def write_all(self, infos: Iterable[InfoMessage]) -> int:
+        """Записать все сообщения и вернуть их количество."""
+        return self.write_lines(map(self.format, infos))
+
+    def __enter__(self) -> 'BulkWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
@@ -0,0 +1,150 @@
+"""Хранилище результатов, разбитое на файлы по дням и типам.
+
+Каталог хранилища содержит файлы `ГГГГ-ММ-ДД/<тип>.bin` с записями
+`RESULT` и индекс `index.json` с числом записей и диапазоном времени
+каждого файла. Запись только дописывается в конец. Выборки читают
+через `mmap` лишь файлы, подходящие по типу и дате, и обрабатывают их
+блоками, не загружая всё хранилище в память.
+
+Индекс заменяется после записи данных, поэтому он — источник истины:
+записи за пределами его счётчика остались от прерванного дописывания.
+Чтение их не видит, а дописывание начинается сразу после учтённых
+записей и обрезает хвост. Файлы вне индекса не трогаются. При открытии
+меняется лишь индекс, если файл короче его счётчика.
+
+Писатель у хранилища должен быть один: `append` из двух процессов
+сразу теряет записи.
+"""
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from aggregates import RunningStats
+from homework import InfoMessage
+
+RESULT = np.dtype([('timestamp', '<f8'),
+                   ('duration', '<f8'),
+                   ('distance', '<f8'),
+                   ('speed', '<f8'),
+                   ('calories', '<f8')])
+METRICS = RESULT.names[1:]
+INDEX_FILE = 'index.json'
+
+
+def _day(timestamp: float) -> str:
+    moment = datetime.fromtimestamp(timestamp, timezone.utc)
+    return moment.strftime('%Y-%m-%d')
+
+
+class ResultStore:
+    """Дописываемое хранилище `InfoMessage` с индексом по типу и дню."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        index = self.path / INDEX_FILE
+        self.index: Dict[str, Dict[str, dict]] = (
+            json.loads(index.read_text()) if index.exists() else {})
+        self._recover()
+
+    def _shard(self, day: str, training_type: str) -> Path:
+        return self.path / day / f'{training_type}.bin'
+
+    def _recover(self) -> None:
+        """Уменьшить счётчики индекса до числа записей в файлах."""
+        changed = False
+        for training_type, days in self.index.items():
+            for day, entry in list(days.items()):
+                shard = self._shard(day, training_type)
+                size = shard.stat().st_size if shard.exists() else 0
+                count = min(entry['count'], size // RESULT.itemsize)
+                if count == entry['count']:
+                    continue
+                changed = True
+                if not count:
+                    del days[day]
+                    continue
+                times = np.memmap(shard, dtype=RESULT, mode='r',
+                                  shape=(count,))['timestamp']
+                entry.update(count=count, start=float(times.min()),
+                             end=float(times.max()))
+        if changed:
+            self._save_index()
+
+    def append(self, results: Iterable[Tuple[float, InfoMessage]]) -> int:
+        """Дописать пары (время UNIX, сообщение). Вернуть их число."""
+        groups: Dict[Tuple[str, str], list] = {}
+        for timestamp, info in results:
+            key = (_day(timestamp), info.training_type)
+            groups.setdefault(key, []).append(
+                (timestamp, info.duration, info.distance, info.speed,
+                 info.calories))
+        for (day, training_type), rows in groups.items():
+            records = np.array(rows, dtype=RESULT)
+            shard = self._shard(day, training_type)
+            shard.parent.mkdir(exist_ok=True)
+            first = float(records['timestamp'].min())
+            last = float(records['timestamp'].max())
+            entry = self.index.setdefault(training_type, {}).setdefault(
+                day, {'count': 0, 'start': first, 'end': last})
+            with open(shard, 'r+b' if shard.exists() else 'wb') as file:
+                file.seek(entry['count'] * RESULT.itemsize)
+                file.truncate()
+                records.tofile(file)
+            entry['count'] += len(records)
+            entry['start'] = min(entry['start'], first)
+            entry['end'] = max(entry['end'], last)
+        self._save_index()
+        return sum(map(len, groups.values()))
+
+    def _save_index(self) -> None:
+        temporary = self.path / (INDEX_FILE + '.tmp')
+        temporary.write_text(json.dumps(self.index))
+        temporary.replace(self.path / INDEX_FILE)
+
+    def scan(self, training_type: str,
+             start: Optional[float] = None,
+             end: Optional[float] = None,
+             chunk_size: int = 65536) -> Iterator[np.ndarray]:
+        """Лениво выдать блоки записей типа за полуинтервал [start, end)."""
+        start = -np.inf if start is None else start
+        end = np.inf if end is None else end
+        for day, entry in sorted(self.index.get(training_type, {}).items()):
+            if entry['end'] < start or entry['start'] >= end:
+                continue
+            records = np.memmap(self._shard(day, training_type),
+                                dtype=RESULT, mode='r',
+                                shape=(entry['count'],))
+            inside = entry['start'] >= start and entry['end'] < end
+            for offset in range(0, len(records), chunk_size):
+                block = records[offset:offset + chunk_size]
+                if not inside:
+                    times = block['timestamp']
+                    block = block[(times >= start) & (times < end)]
+                if len(block):
+                    yield block
+
+    def aggregate(self, training_type: str,
+                  start: Optional[float] = None,
+                  end: Optional[float] = None) -> Dict[str, RunningStats]:
+        """Посчитать показатели `METRICS` за интервал по блокам."""
+        totals = {metric: RunningStats() for metric in METRICS}
+        for block in self.scan(training_type, start, end):
+            for metric in METRICS:
+                totals[metric].merge(_block_stats(block[metric]))
+        return totals
+
+
+def _block_stats(values: np.ndarray) -> RunningStats:
+    """Показатели блока значений для объединения через `merge`."""
+    stats = RunningStats()
+    stats.count = len(values)
+    stats.total = float(values.sum())
+    stats.mean = stats.total / stats.count
+    stats.m2 = float(((values - stats.mean) ** 2).sum())
+    stats.minimum = float(values.min())
+    stats.maximum = float(values.max())
+    return stats
@@ -0,0 +1,48 @@
+import statistics
+
+import pytest
+
+import homework
+from aggregates import RunningStats, TrainingAggregator
+
+PACKAGES = [
+    ('RUN', [15000, 1, 75]),
+    ('RUN', [1206, 12, 6]),
+    ('RUN', [420, 4, 20]),
+    ('SWM', [720, 1, 80, 25, 40]),
+]
+
+
+def test_running_stats_matches_statistics():
+    values = [3.5, 1.25, 8.0, 2.75, 4.0]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.count == 5
+    assert stats.total == pytest.approx(sum(values))
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert (stats.minimum, stats.maximum) == (1.25, 8.0)
+
+
+def test_merge_equals_single_pass():
+    single = TrainingAggregator()
+    first, second = TrainingAggregator(), TrainingAggregator()
+    for i, package in enumerate(PACKAGES):
+        single.add_package('anna', *package)
+        (first if i % 2 else second).add_package('anna', *package)
+    first.merge(second)
+    merged = first.get('anna', 'Running')
+    expected = single.get('anna', 'Running')
+    for metric, values in expected.items():
+        for name, value in values.items():
+            assert merged[metric][name] == pytest.approx(value)
+    calories = [homework.read_package(*package).get_spent_calories()
+                for package in PACKAGES[:3]]
+    assert expected['calories']['total'] == pytest.approx(sum(calories))
+    assert first.get('anna', 'Swimming')['distance']['count'] == 1
+
+
+def test_unknown_key():
+    with pytest.raises(KeyError):
+        TrainingAggregator().get('anna', 'Running')
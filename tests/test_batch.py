@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+import batch
+import fixed_point
+import homework
+
+
+@pytest.mark.parametrize('workout_type, packages', [
+    ('SWM', [[720, 1, 80, 25, 40], [420, 4, 20, 42, 4],
+             [1206, 12, 6, 12, 6]]),
+    ('RUN', [[15000, 1, 75], [420, 4, 20], [1206, 12, 6]]),
+    ('WLK', [[9000, 1, 75, 180], [9000, 1.5, 75, 180],
+             [3000.33, 2.512, 75.8, 180.1]]),
+])
+def test_compute_batch_matches_training(workout_type, packages):
+    fields = homework.WORKOUT_TYPES[workout_type].FIELDS
+    columns = {name: [data[i] for data in packages]
+               for i, name in enumerate(fields)}
+    result = batch.compute_batch(workout_type, columns)
+    for i, data in enumerate(packages):
+        info = homework.read_package(workout_type, data).show_training_info()
+        for name in ('duration', 'distance', 'speed', 'calories'):
+            assert np.isclose(result[name][i], getattr(info, name),
+                              rtol=1e-12, atol=0), (
+                f'Колонка `{name}` не совпадает с `show_training_info`.'
+            )
+
+
+def test_compute_batch_unknown_workout():
+    with pytest.raises(ValueError):
+        batch.compute_batch('XXX', {})
+
+
+def test_compute_batch_missing_column():
+    with pytest.raises(ValueError):
+        batch.compute_batch('RUN', {'action': [1], 'duration': [1]})
+
+
+def _random_columns(workout_type, size=200000):
+    """Случайные тренировки по всему диапазону из `compute_batch_fixed`.
+
+    Скорость и дистанция плавания берутся логравномерно, чтобы чаще
+    попадать на нижние границы, а первые строки стоят ровно на них.
+    """
+    rng = np.random.default_rng(1)
+    duration = rng.uniform(0.5, 4, size)
+    speed = np.exp(rng.uniform(0, np.log(25), size))
+    duration[:2], speed[:2] = 0.5, 1
+    columns = {'duration': duration, 'weight': rng.uniform(40, 150, size)}
+    if workout_type == 'SWM':
+        length_pool = rng.choice([10.0, 25.0, 50.0], size)
+        distance = np.exp(rng.uniform(np.log(0.1), np.log(10), size))
+        distance[:2] = 0.1
+        columns.update(
+            action=distance * 1000 / homework.Swimming.LEN_STEP,
+            length_pool=length_pool,
+            count_pool=np.ceil(speed * duration * 1000 / length_pool))
+    else:
+        columns['action'] = (speed * duration * 1000
+                             / homework.Training.LEN_STEP)
+        if workout_type == 'WLK':
+            columns['height'] = rng.uniform(140, 210, size)
+    return columns
+
+
+@pytest.mark.parametrize('workout_type, bounds', [
+    ('RUN', (3e-4, 7e-4, 6e-4)),
+    ('WLK', (3e-4, 7e-4, 6e-4)),
+    ('SWM', (1.5e-3, 7e-4, 4e-4)),
+])
+def test_reduced_precision_error_bounds(workout_type, bounds):
+    columns = _random_columns(workout_type)
+    exact = batch.compute_batch(workout_type, columns)
+    single = batch.compute_batch(workout_type, columns, dtype=np.float32)
+    fixed = batch.compute_batch_fixed(workout_type, columns)
+    for name, bound in zip(('distance', 'speed', 'calories'), bounds):
+        assert single[name].dtype == np.float32
+        assert fixed[name].dtype == np.int32
+        assert np.allclose(single[name], exact[name], rtol=1e-6, atol=0)
+        assert np.allclose(fixed[name] / fixed_point.ONE, exact[name],
+                           rtol=bound, atol=0)
+
+
+def test_fixed_point_out_of_range():
+    with pytest.raises(ValueError):
+        batch.compute_batch_fixed(
+            'RUN', {'action': [1e6], 'duration': [1], 'weight': [75]})
+
+
+@pytest.mark.parametrize('workout_type, columns', [
+    ('RUN', {'action': [15000], 'duration': [0.0001], 'weight': [75]}),
+    ('WLK', {'action': [9000], 'duration': [1], 'weight': [75],
+             'height': [0.0001]}),
+    ('SWM', {'action': [720], 'duration': [0.0001], 'weight': [80],
+             'length_pool': [25], 'count_pool': [40]}),
+])
+def test_fixed_point_zero_divisor(workout_type, columns):
+    with pytest.raises(ZeroDivisionError):
+        batch.compute_batch_fixed(workout_type, columns)
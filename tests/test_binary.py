@@ -0,0 +1,73 @@
+import io
+import json
+
+import numpy as np
+import pytest
+
+import binary
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+]
+
+
+def test_roundtrip(tmp_path):
+    path = str(tmp_path / 'packages.bin')
+    assert binary.write_packages(path, PACKAGES, chunk_size=3) == 4
+    packages = list(binary.iter_packages(path, chunk_size=3))
+    assert packages == [(code, tuple(data)) for code, data in PACKAGES]
+    for package, expected in zip(packages, PACKAGES):
+        assert (homework.read_package_fast(*package).show_training_info()
+                == homework.read_package(*expected).show_training_info())
+
+
+def test_compute_file(tmp_path):
+    path = str(tmp_path / 'packages.bin')
+    binary.write_packages(path, PACKAGES)
+    result = binary.compute_file(path)
+    assert sorted(result) == ['RUN', 'SWM', 'WLK']
+    expected = [homework.read_package(*package).get_spent_calories()
+                for package in PACKAGES if package[0] == 'RUN']
+    assert np.allclose(result['RUN']['calories'], expected)
+
+
+def test_convert_feeds(tmp_path):
+    json_path = str(tmp_path / 'json.bin')
+    text_path = str(tmp_path / 'text.bin')
+    json_feed = io.StringIO('\n'.join(
+        json.dumps({'workout_type': code, 'data': data})
+        for code, data in PACKAGES))
+    text_feed = io.StringIO('\n'.join(
+        ' '.join([code, *map(str, data)]) for code, data in PACKAGES))
+    assert binary.convert_json_lines(json_feed, json_path) == 4
+    assert binary.convert_text(text_feed, text_path) == 4
+    assert (list(binary.iter_packages(json_path))
+            == list(binary.iter_packages(text_path)))
+
+
+def test_bad_file(tmp_path):
+    path = tmp_path / 'bad.bin'
+    path.write_bytes(b'garbage!')
+    with pytest.raises(ValueError):
+        binary.open_packages(str(path))
+
+
+def test_long_code_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        binary.write_packages(str(tmp_path / 'long.bin'),
+                              [('RUNNING', [15000, 1, 75])])
+
+
+def test_field_count_checked(tmp_path):
+    path = str(tmp_path / 'packages.bin')
+    binary.write_packages(path, [*PACKAGES, ('RUN', [15000, 1])])
+    with pytest.raises(ValueError):
+        binary.read_columns(path)
+    errors = []
+    result = binary.compute_file(path, errors)
+    assert errors == [4]
+    assert len(result['RUN']['calories']) == 2
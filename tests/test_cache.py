@@ -0,0 +1,42 @@
+import pytest
+
+import cache
+import homework
+
+
+def test_package_message_cached():
+    message_cache = cache.MessageCache(maxsize=2)
+    expected = (homework.read_package('RUN', [15000, 1, 75])
+                .show_training_info().get_message())
+    assert message_cache.get_package_message('RUN', [15000, 1, 75]) == (
+        expected)
+    assert message_cache.get_package_message('RUN', [15000, 1, 75]) == (
+        expected)
+    assert (message_cache.hits, message_cache.misses) == (1, 1)
+
+
+def test_lru_eviction():
+    message_cache = cache.MessageCache(maxsize=2)
+    message_cache.get_package_message('RUN', [15000, 1, 75])
+    message_cache.get_package_message('WLK', [9000, 1, 75, 180])
+    message_cache.get_package_message('RUN', [15000, 1, 75])
+    message_cache.get_package_message('SWM', [720, 1, 80, 25, 40])
+    assert len(message_cache) == 2
+    message_cache.get_package_message('RUN', [15000, 1, 75])
+    message_cache.get_package_message('WLK', [9000, 1, 75, 180])
+    assert (message_cache.hits, message_cache.misses) == (2, 4)
+
+
+def test_info_message_cached():
+    message_cache = cache.MessageCache()
+    info = homework.InfoMessage('Running', 1, 2, 3, 4)
+    assert message_cache.get_message(info) == info.get_message()
+    message_cache.get_message(homework.InfoMessage('Running', 1, 2, 3, 4))
+    assert message_cache.hits == 1
+    message_cache.clear()
+    assert len(message_cache) == message_cache.hits == 0
+
+
+def test_bad_maxsize():
+    with pytest.raises(ValueError):
+        cache.MessageCache(maxsize=0)
@@ -0,0 +1,41 @@
+import pytest
+
+import columnar
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ('RUN', [1206, 12, 6]),
+    ('SWM', [420, 4, 20, 42, 4]),
+]
+
+
+def infos():
+    return [homework.read_package(*package).show_training_info()
+            for package in PACKAGES]
+
+
+def test_roundtrip_is_lossless(tmp_path):
+    path = str(tmp_path / 'results.col')
+    with columnar.ColumnarWriter(path, chunk_rows=2) as writer:
+        assert writer.write_all(infos()) == 5
+    table = columnar.load(path)
+    restored = [homework.InfoMessage(*row)
+                for row in zip(*(table[name].tolist()
+                                 for name in columnar.FIELDS))]
+    assert restored == infos()
+
+
+def test_select_columns(tmp_path):
+    path = str(tmp_path / 'results.col')
+    with columnar.ColumnarWriter(path, chunk_rows=3) as writer:
+        for info in infos():
+            writer.write(info)
+    chunks = list(columnar.iter_chunks(path, ['calories']))
+    assert [list(chunk) for chunk in chunks] == [['calories'], ['calories']]
+    types = columnar.load(path, ['training_type'])['training_type']
+    assert types.tolist() == [info.training_type for info in infos()]
+    with pytest.raises(ValueError):
+        columnar.load(path, ['weight'])
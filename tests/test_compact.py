@@ -0,0 +1,51 @@
+import pytest
+
+import compact
+import homework
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_compact_matches_homework(input_data):
+    training = compact.read_package(*input_data)
+    assert not hasattr(training, '__dict__'), (
+        'Компактная тренировка не должна иметь `__dict__`.'
+    )
+    info = training.show_training_info()
+    assert not hasattr(info, '__dict__')
+    expected = homework.read_package(*input_data).show_training_info()
+    assert info.training_type == expected.training_type
+    assert info.get_message() == expected.get_message()
+
+
+def test_compact_unknown_workout():
+    with pytest.raises(ValueError):
+        compact.read_package('XXX', [])
+
+
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+def test_compact_mirrors_public_api(workout_type):
+    original = homework.WORKOUT_TYPES[workout_type]
+    slotted = compact.WORKOUT_TYPES[workout_type]
+    public = {name for name in dir(original) if not name.startswith('_')}
+    assert public <= set(dir(slotted))
+    assert slotted.FIELDS == original.FIELDS
+    assert slotted.CALORIE_COEFFS == original.CALORIE_COEFFS
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', (720, 1, 80, 25, 40)),
+    ('RUN', (15000, 1, 75)),
+    ('WLK', (9000, 1, 75, 180)),
+])
+def test_compact_from_tuple(input_data):
+    training = compact.read_package_fast(*input_data)
+    assert type(training) is compact.WORKOUT_TYPES[input_data[0]]
+    assert training.show_training_info().get_message() == (
+        homework.read_package_fast(*input_data)
+        .show_training_info().get_message())
+    with pytest.raises(ValueError):
+        compact.read_package_fast('XXX', ())
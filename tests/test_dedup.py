@@ -0,0 +1,38 @@
+import pytest
+
+import dedup
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [15000, 1, 75]),
+    ('RUN', [15000, 1, 75]),
+]
+
+
+def test_matches_read_package():
+    result = dedup.compute_deduplicated(PACKAGES)
+    expected = [homework.read_package(workout_type, data)
+                .show_training_info() for workout_type, data in PACKAGES]
+    assert result.infos == expected
+    assert result.unique == 3
+    assert result.ratio == 2
+
+
+def test_repeats_share_message():
+    infos = dedup.compute_deduplicated(PACKAGES).infos
+    assert infos[1] is infos[4] is infos[5]
+    assert infos[0] is not infos[1]
+
+
+def test_empty():
+    result = dedup.compute_deduplicated([])
+    assert (result.infos, result.unique, result.ratio) == ([], 0, 1.0)
+
+
+def test_unknown_workout():
+    with pytest.raises(ValueError, match='Недоступная тренировка'):
+        dedup.compute_deduplicated([('XXX', [1, 2, 3])])
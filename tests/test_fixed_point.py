@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+import fixed_point
+
+
+def test_arithmetic():
+    first = fixed_point.Fixed.from_float([1.5, 2.25])
+    second = fixed_point.Fixed.from_float([2, 0.5])
+    assert (first * second).to_float().tolist() == [3, 1.125]
+    assert (first / second).to_float().tolist() == [0.75, 4.5]
+    assert (2 * first + 0.5).to_float().tolist() == [3.5, 5]
+    assert np.allclose((first * 0.65 / 1000).to_float(),
+                       [0.000975, 0.0014625], atol=1 / fixed_point.ONE)
+
+
+def test_storage_type():
+    values = fixed_point.Fixed.from_float([1, 0.25])
+    assert values.to_int32().tolist() == [4096, 1024]
+
+
+@pytest.mark.parametrize('values', [[-1], [fixed_point.MAX_VALUE * 2]])
+def test_out_of_range(values):
+    with pytest.raises(ValueError):
+        fixed_point.Fixed.from_float(values)
+
+
+@pytest.mark.parametrize('divisor', [
+    fixed_point.Fixed.from_float([1, 0.0001]), 0])
+def test_zero_divisor(divisor):
+    with pytest.raises(ZeroDivisionError):
+        fixed_point.Fixed.from_float([1, 1]) / divisor
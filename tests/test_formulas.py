@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+import batch
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('SWM', [420, 4, 20, 42, 4]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+    ('RUN', [15000, 1, 75]),
+    ('RUN', [420, 4, 20]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('WLK', [9000, 1.5, 75, 180]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+]
+
+
+def unfolded_calories(training: homework.Training) -> float:
+    """Исходные формулы калорий, до свёртки констант."""
+    speed = training.get_mean_speed()
+    if isinstance(training, homework.Running):
+        return ((training.CALORIES_MEAN_SPEED_MULTIPLIER * speed
+                 + training.CALORIES_MEAN_SPEED_SHIFT)
+                * training.weight / training.M_IN_KM
+                * (training.duration * training.H_IN_MIN))
+    if isinstance(training, homework.SportsWalking):
+        return ((training.FIRST_COEFF * training.weight
+                 + (speed * training.KMH_IN_MS) ** 2
+                 / (training.height / training.M_IN_SM)
+                 * training.SECOND_COEFF * training.weight)
+                * (training.duration * training.H_IN_MIN))
+    return ((speed + training.FIRST_COEFF)
+            * training.SECOND_COEFF * training.weight * training.duration)
+
+
+@pytest.mark.parametrize('input_data', PACKAGES)
+def test_folded_calories_match_unfolded(input_data):
+    training = homework.read_package(*input_data)
+    assert training.get_spent_calories() == pytest.approx(
+        unfolded_calories(training), rel=1e-12), (
+        'Свёрнутая формула должна совпадать с исходной.'
+    )
+
+
+def test_formula_reads_fields_as_attributes():
+    class Timed(homework.Running):
+        @property
+        def duration(self):
+            return self.minutes / 60
+
+        @duration.setter
+        def duration(self, value):
+            self.minutes = value * 60
+
+    training = Timed(15000, 1, 75)
+    training.duration = 2
+    assert training.get_spent_calories() == pytest.approx(
+        homework.Running(15000, 2, 75).get_spent_calories(), rel=1e-12)
+
+
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+def test_folded_batch_matches_method(workout_type):
+    packages = [data for code, data in PACKAGES if code == workout_type]
+    fields = homework.WORKOUT_TYPES[workout_type].FIELDS
+    columns = {name: [data[i] for data in packages]
+               for i, name in enumerate(fields)}
+    result = batch.compute_batch(workout_type, columns)
+    expected = [homework.read_package(workout_type, data)
+                .get_spent_calories() for data in packages]
+    assert np.allclose(result['calories'], expected, rtol=1e-15, atol=0)
+
+
+def test_constants_folded_at_class_creation():
+    assert homework.Running.CALORIE_COEFFS == pytest.approx((1.08, 0.1074))
+    assert homework.Swimming.CALORIE_COEFFS == (2, 2.2)
+    assert homework.Training.CALORIE_COEFFS == ()
+    assert homework.Training(1, 1, 1).get_spent_calories() is None
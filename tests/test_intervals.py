@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import homework
+from intervals import split_intervals
+
+
+def test_running_intervals_match_trainings():
+    times = [0, 0.25, 0.5, 1]
+    actions = [0, 4000, 7000, 15000]
+    result = split_intervals('RUN', times, {'action': actions}, weight=75)
+    for i in range(3):
+        training = homework.Running(actions[i + 1] - actions[i],
+                                    times[i + 1] - times[i], 75)
+        info = training.show_training_info()
+        assert result['distance'][i] == pytest.approx(info.distance)
+        assert result['speed'][i] == pytest.approx(info.speed)
+        assert result['calories'][i] == pytest.approx(info.calories)
+    assert result['distance'].sum() == pytest.approx(
+        homework.Running(15000, 1, 75).get_distance())
+
+
+def test_swimming_and_walking_intervals():
+    swimming = split_intervals(
+        'SWM', [0, 0.5, 1],
+        {'action': [0, 300, 720], 'count_pool': [0, 15, 40]},
+        weight=80, length_pool=25)
+    assert swimming['speed'].tolist() == pytest.approx([0.75, 1.25])
+    walking = split_intervals('WLK', np.linspace(0, 1, 61),
+                              {'action': np.linspace(0, 9000, 61)},
+                              weight=75, height=180)
+    assert len(walking['calories']) == 60
+    assert np.allclose(walking['speed'], 5.85)
+
+
+def test_missing_field():
+    with pytest.raises(ValueError):
+        split_intervals('WLK', [0, 1], {'action': [0, 1]}, weight=75)
+    with pytest.raises(ValueError):
+        split_intervals('RUN', [0, 1], {'action': [0]}, weight=75)
+
+
+@pytest.mark.parametrize('times', [[0, 1, 1], [0, 2, 1], [0, np.nan]])
+def test_times_must_increase(times):
+    samples = {'action': list(range(len(times)))}
+    with pytest.raises(ValueError):
+        split_intervals('RUN', times, samples, weight=75)
@@ -0,0 +1,62 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+import loadgen
+from package_parser import check_values
+
+
+def test_deterministic():
+    first = list(loadgen.generate_packages(100, seed=3))
+    assert first == list(loadgen.generate_packages(100, seed=3))
+    assert first != list(loadgen.generate_packages(100, seed=4))
+
+
+def test_mix_and_values():
+    packages = list(loadgen.generate_packages(
+        3000, mix={'RUN': 70, 'SWM': 30}))
+    counts = Counter(workout_type for workout_type, _ in packages)
+    assert set(counts) == {'RUN', 'SWM'}
+    assert 0.65 < counts['RUN'] / len(packages) < 0.75
+    for workout_type, data in packages:
+        assert check_values(workout_type, tuple(data)) is None
+
+
+def test_run_load():
+    report = loadgen.run_load(loadgen.generate_packages(50))
+    assert report['count'] == 50
+    assert report['records_per_second'] > 0
+    assert 0 < report['wall_records_per_second'] <= (
+        report['records_per_second'])
+    for stage in loadgen.STAGES:
+        assert len(report['timings'][stage]) == 50
+    assert 'p99' in loadgen.format_report(report)
+
+
+def test_percentile():
+    ordered = list(range(1, 1001))
+    assert [loadgen.percentile(ordered, share)
+            for share in loadgen.QUANTILES] == [500, 900, 990, 999]
+    assert loadgen.percentile([7], 0.5) == 7
+    assert loadgen.percentile([], 0.5) == 0
+
+
+def test_parse_mix():
+    assert loadgen.parse_mix('RUN=60,WLK=40') == {'RUN': 60, 'WLK': 40}
+    with pytest.raises(ValueError):
+        loadgen.parse_mix('RUN=x')
+
+
+def test_unknown_workout():
+    with pytest.raises(ValueError):
+        next(loadgen.generate_packages(1, mix={'XXX': 1}))
+
+
+def test_peak_rss_units(monkeypatch):
+    usage = SimpleNamespace(ru_maxrss=2048)
+    monkeypatch.setattr(loadgen.resource, 'getrusage', lambda who: usage)
+    monkeypatch.setattr(loadgen.sys, 'platform', 'linux')
+    assert loadgen._peak_rss_kb() == 2048
+    monkeypatch.setattr(loadgen.sys, 'platform', 'darwin')
+    assert loadgen._peak_rss_kb() == 2
@@ -0,0 +1,22 @@
+import pytest
+
+import homework
+
+
+@pytest.mark.parametrize('input_data, attribute, value', [
+    (('RUN', [15000, 1, 75]), 'action', 9000),
+    (('RUN', [15000, 1, 75]), 'duration', 2),
+    (('WLK', [9000, 1, 75, 180]), 'height', 160),
+    (('WLK', [9000, 1, 75, 180]), 'weight', 60),
+    (('SWM', [720, 1, 80, 25, 40]), 'length_pool', 50),
+    (('SWM', [720, 1, 80, 25, 40]), 'count_pool', 20),
+])
+def test_metrics_follow_changes(input_data, attribute, value):
+    training = homework.read_package(*input_data)
+    training.show_training_info()
+    setattr(training, attribute, value)
+    workout_type, data = input_data
+    fields = dict(zip(homework.WORKOUT_TYPES[workout_type].FIELDS, data))
+    fields[attribute] = value
+    fresh = homework.WORKOUT_TYPES[workout_type](**fields)
+    assert training.show_training_info() == fresh.show_training_info()
@@ -0,0 +1,35 @@
+import homework
+from package_parser import (FIELD_COUNT, NOT_A_NUMBER, OUT_OF_RANGE,
+                            UNKNOWN_WORKOUT, parse_lines)
+
+
+def test_parse_valid_lines():
+    lines = ['SWM 720 1 80 25 40\n', '', '  RUN 15000 1 75',
+             'WLK 9000 1 75 180']
+    packages = list(parse_lines(lines))
+    assert packages == [('SWM', (720, 1, 80, 25, 40)),
+                        ('RUN', (15000, 1, 75)),
+                        ('WLK', (9000, 1, 75, 180))]
+    assert homework.read_package(*packages[1]).get_distance() == 9.75
+
+
+def test_bad_lines_reported_and_skipped():
+    lines = [
+        'XXX 1 1 1',
+        'RUN 15000 1',
+        'RUN 15000 one 75',
+        'RUN 15000 0 75',
+        'WLK 9000 1 75 -180',
+        'SWM 720 1 80 nan 40',
+        'RUN 15000 1 75',
+    ]
+    errors = []
+    assert list(parse_lines(lines, errors)) == [('RUN', (15000, 1, 75))]
+    assert [(error.line, error.column, error.reason) for error in errors] == [
+        (1, 1, UNKNOWN_WORKOUT),
+        (2, 1, FIELD_COUNT),
+        (3, 11, NOT_A_NUMBER),
+        (4, 11, OUT_OF_RANGE),
+        (5, 15, OUT_OF_RANGE),
+        (6, 14, OUT_OF_RANGE),
+    ]
@@ -0,0 +1,23 @@
+import pytest
+
+import parallel
+import pipeline
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+]
+
+
+def test_run_parallel_preserves_order():
+    packages = PACKAGES * 25
+    result = list(parallel.run_parallel(iter(packages), workers=2,
+                                        chunk_size=7))
+    assert result == list(pipeline.iter_messages(packages))
+
+
+def test_run_parallel_bad_chunk_size():
+    with pytest.raises(ValueError):
+        list(parallel.run_parallel(PACKAGES, chunk_size=0))
@@ -0,0 +1,41 @@
+import io
+import itertools
+
+import homework
+import pipeline
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def test_iter_messages_matches_main():
+    expected = [
+        homework.read_package(*package).show_training_info().get_message()
+        for package in PACKAGES
+    ]
+    assert list(pipeline.iter_messages(iter(PACKAGES))) == expected
+
+
+def test_iter_messages_is_lazy():
+    endless = itertools.cycle(PACKAGES)
+    messages = pipeline.iter_messages(endless)
+    assert len(list(itertools.islice(messages, 10))) == 10
+
+
+def test_write_messages_in_chunks():
+    class CountingStream(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    stream = CountingStream()
+    count = pipeline.run(PACKAGES * 5, stream, chunk_size=4)
+    lines = stream.getvalue().splitlines()
+    assert count == len(lines) == 15
+    assert stream.writes == 4
+    assert lines[0].startswith('Тип тренировки: Swimming;')
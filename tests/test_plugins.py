@@ -0,0 +1,145 @@
+import importlib.metadata
+import sys
+import textwrap
+import threading
+
+import pytest
+
+import batch
+import homework
+import package_parser
+
+PLUGIN = textwrap.dedent('''
+    from homework import Training, register_workout
+
+
+    @register_workout('{code}')
+    class Cycling(Training):
+        LEN_STEP = 5.0
+        CALORIES_WEIGHT_MULTIPLIER = 7
+
+        @classmethod
+        def fold_calorie_constants(cls):
+            return (cls.CALORIES_WEIGHT_MULTIPLIER,)
+
+        @staticmethod
+        def calories_formula(coeffs, speed, fields):
+            return coeffs[0] * fields.weight * fields.duration
+''')
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+    monkeypatch.setattr(homework, 'LAZY_WORKOUTS', {})
+    monkeypatch.setattr(homework, '_entry_points_loaded', True)
+    yield tmp_path
+    for name in ('cycling_plugin', 'rowing_plugin'):
+        sys.modules.pop(name, None)
+
+
+def test_lazy_workout_imported_on_first_use(plugin_dir):
+    (plugin_dir / 'cycling_plugin.py').write_text(PLUGIN.format(code='CYC'))
+    homework.register_lazy_workout('CYC', 'cycling_plugin:Cycling')
+    assert 'cycling_plugin' not in sys.modules
+    training = homework.read_package('CYC', [1000, 2, 70])
+    assert 'cycling_plugin' in sys.modules
+    assert type(training).__name__ == 'Cycling'
+    assert training.show_training_info().calories == 980
+    result = batch.compute_batch('CYC', {'action': [1000], 'duration': [2],
+                                         'weight': [70]})
+    assert result['calories'].tolist() == [980]
+
+
+def test_workout_from_entry_point(plugin_dir, monkeypatch):
+    (plugin_dir / 'rowing_plugin.py').write_text(PLUGIN.format(code='ROW'))
+
+    def entry_points(group):
+        assert group == homework.ENTRY_POINT_GROUP
+        return [importlib.metadata.EntryPoint(
+            'ROW', 'rowing_plugin:Cycling', group)]
+
+    monkeypatch.setattr(importlib.metadata, 'entry_points', entry_points)
+    monkeypatch.setattr(homework, '_entry_points_loaded', False)
+    assert homework.read_package('ROW', [1000, 2, 70]).get_distance() == 5
+    with pytest.raises(ValueError):
+        homework.read_package('XXX', [1, 1, 1])
+
+
+def test_batch_falls_back_to_methods(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+
+    @homework.register_workout('HIK')
+    class Hiking(homework.Training):
+        def get_mean_speed(self):
+            return self.get_distance() / (self.duration + 0.5)
+
+        def get_spent_calories(self):
+            return self.weight * self.get_mean_speed()
+
+    @homework.register_workout('CLB')
+    class Climbing(homework.Running):
+        def get_distance(self):
+            return self.action / 10
+
+    columns = {'action': [1000, 3000], 'duration': [1, 2],
+               'weight': [70, 80]}
+    for workout_type in ('HIK', 'CLB'):
+        result = batch.compute_batch(workout_type, columns)
+        for i, data in enumerate(zip(*columns.values())):
+            info = homework.read_package(
+                workout_type, list(data)).show_training_info()
+            for name in ('distance', 'speed', 'calories'):
+                assert result[name][i] == pytest.approx(
+                    getattr(info, name), rel=1e-12)
+        with pytest.raises(ValueError):
+            batch.compute_batch_fixed(workout_type, columns)
+
+
+def test_concurrent_lookup_waits_for_scan(plugin_dir, monkeypatch):
+    (plugin_dir / 'rowing_plugin.py').write_text(PLUGIN.format(code='ROW'))
+    scanning = threading.Event()
+    release = threading.Event()
+
+    def entry_points(group):
+        scanning.set()
+        release.wait(5)
+        return [importlib.metadata.EntryPoint(
+            'ROW', 'rowing_plugin:Cycling', group)]
+
+    monkeypatch.setattr(importlib.metadata, 'entry_points', entry_points)
+    monkeypatch.setattr(homework, '_entry_points_loaded', False)
+    results = []
+
+    def lookup():
+        try:
+            results.append(homework.get_workout('ROW').__name__)
+        except ValueError as error:
+            results.append(error)
+
+    first = threading.Thread(target=lookup)
+    first.start()
+    scanning.wait(5)
+    second = threading.Thread(target=lookup)
+    second.start()
+    release.set()
+    first.join()
+    second.join()
+    assert results == ['Cycling', 'Cycling']
+
+
+@pytest.mark.parametrize('target', ['missing_plugin:Cycling',
+                                    'homework:Missing'])
+def test_broken_plugin_is_unknown_workout(plugin_dir, target):
+    homework.register_lazy_workout('BAD', target)
+    with pytest.raises(ValueError):
+        homework.get_workout('BAD')
+    errors = []
+    packages = list(package_parser.parse_lines(
+        ['RUN 15000 1 75', 'BAD 1 1 1', 'WLK 9000 1 75 180'], errors))
+    assert [code for code, _ in packages] == ['RUN', 'WLK']
+    assert [(error.line, error.reason) for error in errors] == [
+        (2, package_parser.UNKNOWN_WORKOUT)]
@@ -0,0 +1,61 @@
+import pytest
+
+import homework
+from conftest import Capturing
+from profiling import UNKNOWN_LABEL, Profiler
+
+
+def test_profiler_counts_stages():
+    original = homework.read_package
+    with Profiler() as profiler:
+        with Capturing():
+            for package in (('RUN', [15000, 1, 75]),
+                            ('RUN', [1206, 12, 6]),
+                            ('SWM', [720, 1, 80, 25, 40])):
+                homework.main(homework.read_package(*package))
+    assert homework.read_package is original, (
+        'После выключения профилировщик должен вернуть исходные функции.'
+    )
+    histograms = profiler.histograms
+    assert histograms['read_package', 'RUN'].count == 2
+    assert histograms['get_spent_calories', 'Swimming'].count == 1
+    assert histograms['get_message', 'Running'].count == 2
+    assert histograms['main', 'Swimming'].count == 1
+    assert 'get_distance' in profiler.summary()
+    exported = profiler.to_prometheus()
+    assert ('training_stage_seconds_count{stage="read_package",'
+            'workout="RUN"} 2') in exported
+    assert 'le="+Inf"' in exported
+
+
+def test_profiler_disabled_has_no_wrappers():
+    original = homework.Training.__dict__['get_spent_calories']
+    profiler = Profiler()
+    profiler.enable()
+    assert homework.Training.__dict__['get_spent_calories'] is not original
+    profiler.disable()
+    assert homework.Training.__dict__['get_spent_calories'] is original
+    profiler.reset()
+    assert not profiler.histograms
+
+
+def test_profiler_keyword_arguments():
+    with Profiler() as profiler:
+        training = homework.read_package(workout_type='RUN',
+                                         data=[15000, 1, 75])
+        with pytest.raises(TypeError):
+            homework.read_package()
+    assert isinstance(training, homework.Running)
+    assert profiler.histograms['read_package', 'RUN'].count == 1
+    assert profiler.histograms['read_package', UNKNOWN_LABEL].count == 1
+
+
+@pytest.mark.parametrize('code, error', [(123, ValueError),
+                                         (['RUN'], TypeError)])
+def test_profiler_non_string_code(code, error):
+    with Profiler() as profiler:
+        with pytest.raises(error):
+            homework.read_package(code, [15000, 1, 75])
+    assert profiler.histograms['read_package', UNKNOWN_LABEL].count == 1
+    assert 'read_package' in profiler.summary()
+    assert UNKNOWN_LABEL in profiler.to_prometheus()
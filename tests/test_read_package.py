@@ -0,0 +1,100 @@
+import pytest
+
+import homework
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_read_package_fast(input_data):
+    workout_type, data = input_data
+    fast = homework.read_package_fast(workout_type, tuple(data))
+    regular = homework.read_package(workout_type, data)
+    assert type(fast) is type(regular)
+    assert vars(fast) == vars(regular)
+    assert fast.show_training_info() == regular.show_training_info()
+
+
+def test_register_workout(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+
+    @homework.register_workout('TST')
+    class Testing(homework.Running):
+        pass
+
+    assert isinstance(homework.read_package('TST', [1, 1, 1]), Testing)
+    with pytest.raises(ValueError):
+        homework.read_package('XXX', [1, 1, 1])
+
+
+def test_read_package_fast_extra_fields(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+
+    @homework.register_workout('TSS')
+    class Strokes(homework.Swimming):
+        FIELDS = homework.Swimming.FIELDS + ('strokes',)
+
+        def __init__(self, action, duration, weight, length_pool,
+                     count_pool, strokes):
+            super().__init__(action, duration, weight, length_pool,
+                             count_pool)
+            self.strokes = strokes
+
+    values = (720, 1, 80, 25, 40, 300)
+    fast = homework.read_package_fast('TSS', values)
+    assert vars(fast) == vars(homework.read_package('TSS', list(values)))
+
+
+def test_read_package_fast_lazy_workout(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+    monkeypatch.setattr(homework, 'LAZY_WORKOUTS', {})
+    homework.register_lazy_workout('LZY', 'homework:Running')
+    training = homework.read_package_fast('LZY', (15000, 1, 75))
+    assert type(training) is homework.Running
+
+
+def test_from_tuple_builds_fields_directly(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+
+    calls = []
+
+    @homework.register_workout('TFT')
+    class Plain(homework.SportsWalking):
+        def __init__(self, *values):
+            calls.append(values)
+            super().__init__(*values)
+
+    values = (9000, 1, 75, 180)
+    first = homework.read_package_fast('TFT', values)
+    second = homework.read_package_fast('TFT', values)
+    assert len(calls) == 1
+    assert list(vars(second)) == list(Plain.FIELDS)
+    assert vars(first) == vars(second)
+    assert type(second) is Plain
+
+
+def test_from_tuple_keeps_converting_init(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+
+    @homework.register_workout('TCV')
+    class Converting(homework.Running):
+        def __init__(self, action, duration, weight):
+            super().__init__(int(action), duration, weight)
+
+    for _ in range(2):
+        training = homework.read_package_fast('TCV', ('15000', 1, 75))
+        assert training.action == 15000
+
+    class Child(Converting):
+        def __init__(self, action, duration, weight):
+            super().__init__(action, duration * 2, weight)
+
+    assert Child.from_tuple(('15000', 1, 75)).duration == 2
+    assert Child.from_tuple(('15000', 1, 75)).duration == 2
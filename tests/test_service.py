@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import homework
+from service import TrainingService
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+async def _exchange(lines):
+    service = TrainingService(max_batch=2)
+    server = await service.start('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(''.join(line + '\n' for line in lines).encode())
+    await writer.drain()
+    replies = [json.loads(await asyncio.wait_for(reader.readline(), 5))
+               for _ in lines]
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    await service.stop()
+    return replies, service
+
+
+def test_service_replies_in_order():
+    lines = [json.dumps({'workout_type': code, 'data': data})
+             for code, data in PACKAGES * 3]
+    replies, service = asyncio.run(_exchange(lines))
+    expected = [
+        {'message': homework.read_package(*package)
+         .show_training_info().get_message()}
+        for package in PACKAGES * 3
+    ]
+    assert replies == expected
+    assert service.processed == 9
+    assert service.batches >= 5
+
+
+def test_service_reports_errors():
+    lines = [
+        'not json',
+        json.dumps({'workout_type': 'XXX', 'data': [1, 1, 1]}),
+        json.dumps({'workout_type': 'RUN', 'data': [1, 0, 1]}),
+        json.dumps({'workout_type': 'RUN', 'data': [15000, 1, 75]}),
+    ]
+    replies, _ = asyncio.run(_exchange(lines))
+    assert [list(reply) for reply in replies] == [
+        ['error'], ['error'], ['error'], ['message']]
+
+
+def test_service_survives_failing_package(monkeypatch):
+    lines = [
+        json.dumps({'workout_type': 'RUN', 'data': [10 ** 400, 1, 75]}),
+        json.dumps({'workout_type': ['RUN'], 'data': [15000, 1, 75]}),
+        json.dumps({'workout_type': 'WLK', 'data': [9000, 1, 75, 180]}),
+        json.dumps({'workout_type': 'RUN', 'data': [15000, 1, 75]}),
+    ]
+    replies, _ = asyncio.run(_exchange(lines))
+    assert [list(reply) for reply in replies] == [
+        ['error'], ['error'], ['message'], ['message']]
+
+    def broken(*args):
+        raise RuntimeError('сбой')
+
+    monkeypatch.setattr(homework.InfoMessage, 'get_message', broken)
+    replies, _ = asyncio.run(_exchange(lines[3:] * 2))
+    assert replies == [{'error': 'Ошибка расчёта'}] * 2
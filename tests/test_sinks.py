@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+import tempfile
+
+import pytest
+
+import homework
+from sinks import BulkWriter
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def infos():
+    return [homework.read_package(*package).show_training_info()
+            for package in PACKAGES]
+
+
+def test_text_to_bytes():
+    stream = io.BytesIO()
+    assert BulkWriter(stream, block_size=2).write_all(infos()) == 3
+    assert stream.getvalue().decode().splitlines() == [
+        info.get_message() for info in infos()]
+
+
+def test_csv_roundtrip():
+    stream = io.StringIO()
+    with BulkWriter(stream, fmt='csv') as writer:
+        for info in infos():
+            writer.write(info)
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert [homework.InfoMessage(row['training_type'],
+                                 *map(float, list(row.values())[1:]))
+            for row in rows] == infos()
+
+
+def test_jsonl_roundtrip():
+    stream = io.StringIO()
+    BulkWriter(stream, fmt='jsonl').write_all(infos())
+    assert [homework.InfoMessage(**json.loads(line))
+            for line in stream.getvalue().splitlines()] == infos()
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        BulkWriter(io.StringIO(), fmt='xml')
+
+
+def test_jsonl_rejects_non_finite():
+    info = homework.InfoMessage('Running', 1.0, float('inf'), 1.0,
+                                float('nan'))
+    with pytest.raises(ValueError):
+        BulkWriter(io.StringIO(), fmt='jsonl').write(info)
+
+
+@pytest.mark.parametrize('mode', ['w+', 'w+b'])
+def test_spooled_streams(mode):
+    with tempfile.SpooledTemporaryFile(mode=mode) as stream:
+        BulkWriter(stream, block_size=2).write_all(infos())
+        stream.seek(0)
+        text = stream.read()
+    if isinstance(text, bytes):
+        text = text.decode()
+    assert text.splitlines() == [info.get_message() for info in infos()]
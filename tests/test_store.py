@@ -0,0 +1,94 @@
+import os
+import statistics
+
+import numpy as np
+import pytest
+
+import homework
+from store import RESULT, ResultStore
+
+DAY = 86400
+PACKAGES = [
+    ('RUN', [15000, 1, 75]),
+    ('RUN', [1206, 12, 6]),
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [420, 4, 20]),
+]
+
+
+def results():
+    return [(index * DAY / 2,
+             homework.read_package(*package).show_training_info())
+            for index, package in enumerate(PACKAGES)]
+
+
+def test_append_and_scan(tmp_path):
+    store = ResultStore(str(tmp_path))
+    assert store.append(results()) == 4
+    assert sorted(store.index['Running']) == ['1970-01-01', '1970-01-02']
+    reopened = ResultStore(str(tmp_path))
+    blocks = list(reopened.scan('Running', start=DAY / 4))
+    assert [block['timestamp'].tolist() for block in blocks] == [
+        [DAY / 2], [DAY * 1.5]]
+    assert list(reopened.scan('Running', start=DAY * 2)) == []
+    assert list(reopened.scan('Walking')) == []
+
+
+def test_aggregate(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.append(results()[:2])
+    store.append(results()[2:])
+    totals = store.aggregate('Running')
+    calories = [info.calories for _, info in results()
+                if info.training_type == 'Running']
+    assert totals['calories'].count == 3
+    assert totals['calories'].total == pytest.approx(sum(calories))
+    assert totals['calories'].variance == pytest.approx(
+        statistics.variance(calories))
+    assert totals['distance'].maximum == pytest.approx(9.75)
+
+
+def test_recovers_from_interrupted_append(tmp_path):
+    store = ResultStore(str(tmp_path))
+    _, info = results()[0]
+    store.append([(10, info)])
+    shard = tmp_path / '1970-01-01' / 'Running.bin'
+    with open(shard, 'ab') as file:
+        np.zeros(1, dtype=RESULT).tofile(file)
+        file.write(b'\0' * 7)
+    reopened = ResultStore(str(tmp_path))
+    assert shard.stat().st_size == 2 * RESULT.itemsize + 7
+    reopened.append([(30, info)])
+    times = [time for block in reopened.scan('Running')
+             for time in block['timestamp'].tolist()]
+    assert times == [10, 30]
+    assert shard.stat().st_size == 2 * RESULT.itemsize
+
+
+def test_leaves_unknown_files(tmp_path):
+    _, info = results()[0]
+    foreign = tmp_path / 'packages' / 'day.bin'
+    foreign.parent.mkdir()
+    foreign.write_bytes(b'data')
+    stray = tmp_path / '1970-01-01' / 'Running.bin'
+    stray.parent.mkdir()
+    stray.write_bytes(bytes(3 * RESULT.itemsize))
+    store = ResultStore(str(tmp_path))
+    assert foreign.read_bytes() == b'data'
+    assert stray.stat().st_size == 3 * RESULT.itemsize
+    store.append([(10, info)])
+    assert [block['timestamp'].tolist()
+            for block in store.scan('Running')] == [[10]]
+    assert foreign.read_bytes() == b'data'
+
+
+def test_index_shrinks_to_file(tmp_path):
+    store = ResultStore(str(tmp_path))
+    _, info = results()[0]
+    store.append([(10, info), (20, info)])
+    shard = tmp_path / '1970-01-01' / 'Running.bin'
+    os.truncate(shard, RESULT.itemsize + 3)
+    reopened = ResultStore(str(tmp_path))
+    assert reopened.index['Running']['1970-01-01'] == {
+        'count': 1, 'start': 10, 'end': 10}
+    assert ResultStore(str(tmp_path)).index == reopened.index
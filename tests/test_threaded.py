@@ -0,0 +1,43 @@
+import threading
+
+import pipeline
+from threaded import ShardedCounter, ShardedMessageCache, run_threaded
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+]
+
+
+def test_counter_under_many_threads():
+    counter = ShardedCounter()
+    barrier = threading.Barrier(16)
+
+    def work():
+        barrier.wait()
+        for _ in range(5000):
+            counter.add('RUN')
+            counter.add('SWM', 2)
+
+    threads = [threading.Thread(target=work) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.totals() == {'RUN': 80000, 'SWM': 160000}
+
+
+def test_run_threaded_stress():
+    packages = PACKAGES * 2000
+    expected = list(pipeline.iter_messages(packages))
+    cache = ShardedMessageCache(maxsize=64, shards=4)
+    counter = ShardedCounter()
+    result = list(run_threaded(iter(packages), workers=16, chunk_size=50,
+                               cache=cache, counter=counter))
+    assert result == expected
+    assert cache.hits + cache.misses == len(packages)
+    assert cache.misses <= len(PACKAGES) * 16
+    assert counter.totals() == {'SWM': 2000, 'RUN': 4000, 'WLK': 2000}
+    assert list(run_threaded(packages[:10], workers=3)) == expected[:10]
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+import homework
+from package_parser import (FIELD_COUNT, NOT_A_NUMBER, OUT_OF_RANGE,
+                            UNKNOWN_WORKOUT)
+from validated import compute_batch_validated, iter_valid_info
+
+
+def test_bad_packages_go_to_dead_letters():
+    packages = [
+        ('RUN', [15000, 1, 75]),
+        ('RUN', [15000, 0, 75]),
+        ('WLK', [9000, 1, 75, 0]),
+        ('XXX', [1, 1, 1]),
+        ('SWM', [720, 1, 80]),
+        ('RUN', ['a', 1, 75]),
+        ('SWM', [720, 1, 80, 25, 40]),
+    ]
+    dead_letters = []
+    result = list(iter_valid_info(packages, dead_letters))
+    assert [index for index, _ in result] == [0, 6]
+    assert result[1][1] == (homework.read_package(*packages[6])
+                            .show_training_info())
+    assert [(letter.index, letter.reason, letter.field)
+            for letter in dead_letters] == [
+        (1, OUT_OF_RANGE, 'duration'),
+        (2, OUT_OF_RANGE, 'height'),
+        (3, UNKNOWN_WORKOUT, ''),
+        (4, FIELD_COUNT, ''),
+        (5, NOT_A_NUMBER, ''),
+    ]
+
+
+def test_compute_batch_validated():
+    columns = {'action': [9000, 9000, 9000, 9000],
+               'duration': [1, 0, 1, 1.5],
+               'weight': [75, 75, np.nan, 75],
+               'height': [180, 180, 180, 180]}
+    dead_letters = []
+    result = compute_batch_validated('WLK', columns, dead_letters)
+    assert result['index'].tolist() == [0, 3]
+    assert np.allclose(result['calories'], [349.252, 364.084], atol=1e-3)
+    assert [(letter.index, letter.field) for letter in dead_letters] == [
+        (1, 'duration'), (2, 'weight')]
+
+
+def test_plugin_with_extra_fields(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+
+    @homework.register_workout('TSS')
+    class Strokes(homework.Running):
+        FIELDS = homework.Running.FIELDS + ('strokes',)
+
+        def __init__(self, action, duration, weight, strokes):
+            super().__init__(action, duration, weight)
+            self.strokes = strokes
+
+    dead_letters = []
+    result = list(iter_valid_info([('TSS', [15000, 1, 75, 300])],
+                                  dead_letters))
+    assert dead_letters == []
+    info = result[0][1]
+    assert info.training_type == 'Strokes'
+    assert info.calories == homework.Running(
+        15000, 1, 75).get_spent_calories()
+
+
+def test_overflow_and_bad_code_go_to_dead_letters():
+    packages = [
+        ('RUN', [10 ** 400, 1, 75]),
+        (['RUN'], [15000, 1, 75]),
+        ('RUN', [15000, 1, 75]),
+    ]
+    dead_letters = []
+    result = list(iter_valid_info(packages, dead_letters))
+    assert [index for index, _ in result] == [2]
+    assert [(letter.index, letter.reason) for letter in dead_letters] == [
+        (0, NOT_A_NUMBER), (1, UNKNOWN_WORKOUT)]
+
+
+def test_compute_batch_validated_bad_cells():
+    columns = {'action': [15000, 'много', 15000, 10 ** 400],
+               'duration': [1, 1, 1, 1],
+               'weight': [75, 75, 75, 75]}
+    dead_letters = []
+    result = compute_batch_validated('RUN', columns, dead_letters)
+    assert result['index'].tolist() == [0, 2]
+    assert [(letter.index, letter.reason, letter.field)
+            for letter in dead_letters] == [
+        (1, NOT_A_NUMBER, 'action'), (3, NOT_A_NUMBER, 'action')]
+    with pytest.raises(ValueError):
+        compute_batch_validated('RUN', {'action': [1]}, [])
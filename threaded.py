@@ -0,0 +1,125 @@
+"""Потокобезопасная обработка пакетов в пуле потоков.
+
+Что можно разделять между потоками:
+
+* классы тренировок и `WORKOUT_TYPES` — только читаются; просмотр
+  точек входа идёт под блокировкой, а импорт плагина опирается на
+  блокировку импорта и `dict.setdefault`;
+* объекты `Training` — показатели считаются заново при каждом вызове
+  и ничего не записывают в объект, поэтому объект можно читать из
+  нескольких потоков; менять его одновременно с чтением нельзя;
+* `ShardedMessageCache` и `ShardedCounter` из этого модуля.
+
+`cache.MessageCache` и `profiling.Profiler` рассчитаны на один поток.
+Модуль не полагается на GIL и работает в сборках CPython без него
+(free-threaded): счётчики пишутся только своим потоком, а кэш разбит на
+сегменты с отдельными блокировками.
+"""
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cache import MessageCache
+from homework import read_package
+from parallel import chunked
+
+Package = Tuple[str, list]
+
+
+class ShardedCounter:
+    """Счётчики, которые каждый поток увеличивает в своём словаре."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: List[Dict[str, int]] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> Dict[str, int]:
+        try:
+            return self._local.counts
+        except AttributeError:
+            counts = self._local.counts = {}
+            with self._lock:
+                self._shards.append(counts)
+            return counts
+
+    def add(self, name: str, value: int = 1) -> None:
+        """Увеличить счётчик текущего потока."""
+        counts = self._shard()
+        counts[name] = counts.get(name, 0) + value
+
+    def totals(self) -> Dict[str, int]:
+        """Суммы счётчиков по всем потокам."""
+        totals: Dict[str, int] = {}
+        with self._lock:
+            shards = list(self._shards)
+        for counts in shards:
+            for name, value in list(counts.items()):
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+
+class ShardedMessageCache:
+    """LRU-кэш сообщений, разбитый на сегменты с отдельными блокировками."""
+
+    def __init__(self, maxsize: int = 4096, shards: int = 16) -> None:
+        if shards < 1:
+            raise ValueError('Число сегментов должно быть положительным')
+        self._shards = [MessageCache(max(1, maxsize // shards))
+                        for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def get_package_message(self, workout_type: str, data: list) -> str:
+        """Получить сообщение по пакету из сегмента его ключа."""
+        index = hash((workout_type, tuple(data))) % len(self._shards)
+        with self._locks[index]:
+            return self._shards[index].get_package_message(
+                workout_type, data)
+
+    @property
+    def hits(self) -> int:
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        return sum(shard.misses for shard in self._shards)
+
+
+def _process_chunk(chunk: List[Package],
+                   cache: Optional[ShardedMessageCache],
+                   counter: Optional[ShardedCounter]) -> List[str]:
+    if cache is None:
+        messages = [read_package(workout_type, data).show_training_info()
+                    .get_message() for workout_type, data in chunk]
+    else:
+        messages = [cache.get_package_message(workout_type, data)
+                    for workout_type, data in chunk]
+    if counter is not None:
+        for workout_type, _ in chunk:
+            counter.add(workout_type)
+    return messages
+
+
+def run_threaded(packages: Iterable[Package],
+                 workers: int = 4,
+                 chunk_size: int = 1024,
+                 cache: Optional[ShardedMessageCache] = None,
+                 counter: Optional[ShardedCounter] = None
+                 ) -> Iterator[str]:
+    """Посчитать сообщения в пуле потоков с сохранением порядка.
+
+    Пакеты обрабатываются блоками по `chunk_size`; в работе одновременно
+    не больше двух блоков на поток.
+    """
+    if chunk_size < 1:
+        raise ValueError('Размер блока должен быть положительным')
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunked(packages, chunk_size):
+            pending.append(executor.submit(
+                _process_chunk, chunk, cache, counter))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,121 @@
+"""Обработка пакетов с отсевом некорректных записей.
+
+Записи проверяются дешёвыми проверками `package_parser.check_values`
+до расчёта. Некорректные попадают в список отклонённых с кодом причины,
+а обработка остальных продолжается, так что один сломанный датчик не
+останавливает весь шард.
+"""
+from typing import Any, Iterable, Iterator, List, Mapping, NamedTuple, Tuple
+
+import numpy as np
+
+from batch import Columns, compute_batch
+from homework import InfoMessage, get_workout, read_package_fast
+from package_parser import (NOT_A_NUMBER, OUT_OF_RANGE, POSITIVE_FIELDS,
+                            UNKNOWN_WORKOUT, check_values)
+
+COMPUTE_ERROR = 'compute_error'
+
+
+class DeadLetter(NamedTuple):
+    """Отклонённая запись с причиной."""
+    index: int
+    workout_type: Any
+    data: Any
+    reason: str
+    field: str
+
+
+def _screen(workout_type: Any, data: Any) -> Tuple[tuple, str, str]:
+    """Привести значения пакета к числам и найти причину отказа.
+
+    Возвращает значения, код причины и имя поля; для корректного
+    пакета причина пустая.
+    """
+    if not isinstance(workout_type, str):
+        return (), UNKNOWN_WORKOUT, ''
+    try:
+        values = tuple(map(float, data))
+    except (TypeError, ValueError, OverflowError):
+        return (), NOT_A_NUMBER, ''
+    problem = check_values(workout_type, values)
+    if problem is None:
+        return values, '', ''
+    reason, index = problem
+    if index < 0:
+        return values, reason, ''
+    return values, reason, get_workout(workout_type).FIELDS[index]
+
+
+def iter_valid_info(packages: Iterable[Tuple[str, Any]],
+                    dead_letters: List[DeadLetter]
+                    ) -> Iterator[Tuple[int, InfoMessage]]:
+    """Лениво посчитать сообщения для корректных пакетов.
+
+    Возвращает пары (номер пакета во входном потоке, сообщение).
+    Некорректные пакеты добавляются в `dead_letters`.
+    """
+    for index, (workout_type, data) in enumerate(packages):
+        values, reason, field = _screen(workout_type, data)
+        if not reason:
+            try:
+                yield index, read_package_fast(
+                    workout_type, values).show_training_info()
+                continue
+            except ArithmeticError:
+                reason = COMPUTE_ERROR
+        dead_letters.append(
+            DeadLetter(index, workout_type, data, reason, field))
+
+
+def _numeric_column(values: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Колонка как float64 и маска ячеек, которые не приводятся к числу."""
+    try:
+        array = np.asarray(values, dtype=np.float64)
+        return array, np.zeros(len(array), dtype=bool)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    cells = []
+    for value in values:
+        try:
+            cells.append(float(value))
+        except (TypeError, ValueError, OverflowError):
+            cells.append(None)
+    broken = np.array([cell is None for cell in cells], dtype=bool)
+    array = np.array([np.nan if cell is None else cell for cell in cells],
+                     dtype=np.float64)
+    return array, broken
+
+
+def compute_batch_validated(workout_type: str,
+                            columns: Mapping[str, Any],
+                            dead_letters: List[DeadLetter]) -> Columns:
+    """Пакетный расчёт только по строкам, прошедшим проверку.
+
+    В результат добавляется колонка `index` с номерами принятых строк;
+    строки с нечисловыми или недопустимыми значениями попадают в
+    `dead_letters`. Как и `compute_batch`, при отсутствии колонки
+    вызывает `ValueError`.
+    """
+    fields = get_workout(workout_type).FIELDS
+    missing = [name for name in fields if name not in columns]
+    if missing:
+        raise ValueError(f'Не передана колонка {missing[0]}')
+    size = len(columns[fields[0]])
+    valid = np.ones(size, dtype=bool)
+    arrays = {}
+    for name in fields:
+        values, broken = _numeric_column(columns[name])
+        arrays[name] = values
+        good = ~broken & np.isfinite(values) & (
+            values > 0 if name in POSITIVE_FIELDS else values >= 0)
+        for index in np.flatnonzero(valid & ~good).tolist():
+            dead_letters.append(DeadLetter(
+                index, workout_type,
+                tuple(columns[field][index] for field in fields),
+                NOT_A_NUMBER if broken[index] else OUT_OF_RANGE, name))
+        valid &= good
+    result = compute_batch(
+        workout_type, {name: values[valid] for name, values in arrays.items()})
+    result['index'] = np.flatnonzero(valid)
+    return result